@@ -0,0 +1,107 @@
+"""
+Numba-compiled kernels for hot geospatial math.
+
+Kernels are plain numeric functions so they compile under numba's
+nopython mode. When numba is not installed the decorator is a no-op and
+the same functions run as ordinary Python, so callers never need to
+check NUMBA_AVAILABLE themselves.
+"""
+
+import math
+
+import numpy as np
+
+# Conditional import - numba is an optional speedup
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Earth's radius (kept local so kernels see compile-time constants)
+EARTH_RADIUS_M = 6371000.0
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit(cache=True, fastmath=True)
+def offset_coord_njit(lat, lon, bearing_deg, dist_m):
+    """
+    Spherical destination point: move dist_m meters from (lat, lon) along
+    bearing_deg (0 = north, 90 = east).
+    
+    Returns:
+        Tuple of (new_lat, new_lon) in degrees
+    """
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    bearing_rad = math.radians(bearing_deg)
+    angular_dist = dist_m / EARTH_RADIUS_M
+    
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_dist = math.sin(angular_dist)
+    cos_dist = math.cos(angular_dist)
+    
+    new_lat_rad = math.asin(sin_lat * cos_dist + cos_lat * sin_dist * math.cos(bearing_rad))
+    new_lon_rad = lon_rad + math.atan2(
+        math.sin(bearing_rad) * sin_dist * cos_lat,
+        cos_dist - sin_lat * math.sin(new_lat_rad),
+    )
+    
+    return (math.degrees(new_lat_rad), math.degrees(new_lon_rad))
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def haversine_nb(lat1, lon1, lat2, lon2):
+    """Great-circle distance in kilometers between two points (degrees)."""
+    lat1r = math.radians(lat1)
+    lat2r = math.radians(lat2)
+    dlat = lat2r - lat1r
+    dlon = math.radians(lon2) - math.radians(lon1)
+    
+    a = math.sin(dlat * 0.5) ** 2 + math.cos(lat1r) * math.cos(lat2r) * math.sin(dlon * 0.5) ** 2
+    
+    return EARTH_RADIUS_KM * 2.0 * math.asin(math.sqrt(a))
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def haversine_batch_nb(lat1, lon1, lats, lons):
+    """
+    Distances in kilometers from one point to arrays of points.
+    
+    Iterates with prange, so numba spreads the destinations across cores.
+    """
+    n = lats.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = haversine_nb(lat1, lon1, lats[i], lons[i])
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True, nogil=True)
+def filter_nearby_nb(lat0, lon0, lats, lons, r_km):
+    """
+    Mask of points within r_km of (lat0, lon0) that also fall inside
+    India's bounding box.
+    
+    Runs without the GIL, so callers may split work across threads.
+    """
+    n = lats.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        lat = lats[i]
+        lon = lons[i]
+        # Bounds check first: it is far cheaper than the trig
+        if lon < 68.0 or lon > 98.0 or lat < 6.0 or lat > 36.0:
+            out[i] = False
+        else:
+            out[i] = haversine_nb(lat0, lon0, lat, lon) <= r_km
+    return out
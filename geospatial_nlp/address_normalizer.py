@@ -15,6 +15,7 @@ Returns structured output with clean_text, landmarks, directions, street_info.
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
@@ -191,6 +192,52 @@ BUILDING_NUMBER_PATTERN = re.compile(
 )
 
 
+@lru_cache(maxsize=32)
+def _compile_abbreviations(items: Tuple[Tuple[str, str], ...]) -> Tuple["re.Pattern", Dict[str, str]]:
+    """
+    Compile an abbreviation map into a single alternation regex.
+    
+    Args:
+        items: (abbreviation, expansion) pairs
+        
+    Returns:
+        Tuple of (compiled pattern, lowercase abbreviation -> expansion).
+        The table is ordered like the pattern's alternatives.
+    """
+    lowered = {abbrev.lower(): expansion for abbrev, expansion in items}
+    
+    # Sort by length descending to match longer abbreviations first
+    # This prevents "b/h" from being partially matched before "bh"
+    table = {a: lowered[a] for a in sorted(lowered, key=len, reverse=True)}
+    
+    # Word boundaries, with an optional trailing period (common in abbreviations)
+    pattern = re.compile(
+        r'\b(' + '|'.join(re.escape(a) for a in table) + r')\.?\b',
+        re.IGNORECASE
+    )
+    return pattern, table
+
+
+def _lookup_abbreviation(table: Dict[str, str], matched: str) -> str:
+    """
+    Find the expansion for text matched by the abbreviation pattern.
+    
+    re.IGNORECASE also matches case-folded characters whose lower() is not
+    a table key (e.g. "\u017ft", long s, for "st"). Those rare matches fall
+    back to the first key, in pattern order, that matches the same way.
+    """
+    expansion = table.get(matched.lower())
+    if expansion is not None:
+        return expansion
+    for abbrev, expansion in table.items():
+        if re.fullmatch(re.escape(abbrev), matched, re.IGNORECASE):
+            return expansion
+    return matched
+
+
+_DEFAULT_ABBREVIATIONS = _compile_abbreviations(tuple(ABBREVIATION_MAP.items()))
+
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -218,8 +265,10 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Step 1: Unicode normalization (NFKC handles compatibility characters)
-    text = unicodedata.normalize("NFKC", text)
+    # Step 1: Unicode normalization (NFKC handles compatibility characters);
+    # pure ASCII is already NFKC-stable, so skip the table walk for it
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
     
     # Step 2: Lowercase for consistent matching
     text = text.lower()
@@ -268,26 +317,19 @@ def expand_abbreviations(text: str, custom_map: Dict[str, str] = None) -> str:
         return ""
     
     # Merge custom mappings with defaults
-    abbrev_map = ABBREVIATION_MAP.copy()
     if custom_map:
+        abbrev_map = ABBREVIATION_MAP.copy()
         abbrev_map.update(custom_map)
+        pattern, table = _compile_abbreviations(tuple(abbrev_map.items()))
+    else:
+        pattern, table = _DEFAULT_ABBREVIATIONS
     
-    # Sort by length descending to match longer abbreviations first
-    # This prevents "b/h" from being partially matched before "bh"
-    sorted_abbrevs = sorted(abbrev_map.keys(), key=len, reverse=True)
+    # One pass over the text; the callback looks the matched abbreviation
+    # up without its optional trailing period
+    def _expand(match: "re.Match") -> str:
+        return _lookup_abbreviation(table, match.group(1))
     
-    result = text
-    for abbrev in sorted_abbrevs:
-        expansion = abbrev_map[abbrev]
-        
-        # Use word boundaries, handle periods in abbreviations
-        # Escape special regex characters in abbreviation
-        escaped = re.escape(abbrev)
-        
-        # Match with optional trailing period (common in abbreviations)
-        pattern = rf'\b{escaped}\.?\b'
-        
-        result = re.sub(pattern, expansion, result, flags=re.IGNORECASE)
+    result = pattern.sub(_expand, text)
     
     # Clean up any double spaces created by replacements
     result = re.sub(r'\s+', ' ', result).strip()
@@ -392,8 +434,15 @@ def extract_address_components(text: str) -> Dict[str, Any]:
     directions = []
     street_info = {}
     
+    # Direction words present anywhere in the text, found with plain
+    # substring checks. Every LANDMARK_PHRASE_PATTERN trigger contains one
+    # of them, so an address without any skips the phrase regex entirely.
+    text_lower = text.lower()
+    present_directions = [d for d in DIRECTION_WORDS if d in text_lower]
+    phrase_matches = LANDMARK_PHRASE_PATTERN.finditer(text) if present_directions else ()
+    
     # Extract landmark phrases (e.g., "near temple", "behind station")
-    for match in LANDMARK_PHRASE_PATTERN.finditer(text):
+    for match in phrase_matches:
         direction_word = match.group(1).lower()
         landmark_text = match.group(2).strip()
         
@@ -413,8 +462,8 @@ def extract_address_components(text: str) -> Dict[str, Any]:
             directions.append(direction_word)
     
     # Add any standalone direction words not captured in landmark phrases
-    for direction in DIRECTION_WORDS:
-        if direction in text.lower() and direction not in directions:
+    for direction in present_directions:
+        if direction not in directions:
             directions.append(direction)
     
     # Extract street/lane numbers
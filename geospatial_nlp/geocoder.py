@@ -18,6 +18,7 @@ would use dedicated geocoding services like Google Maps, HERE, or Mapbox.
 """
 
 import re
+from itertools import groupby
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from functools import lru_cache
@@ -33,6 +34,7 @@ except ImportError:
 from .utils import (
     load_pincode_centroids,
     load_indian_states,
+    find_state_in_text,
     is_within_india,
     validate_pincode,
     haversine_distance,
@@ -282,19 +284,81 @@ class ContextualGeocoder:
         # Try to infer from pincode prefix (less precise)
         # First 3 digits indicate a broader region
         if len(pincode) >= 3:
-            prefix = pincode[:3]
-            for pc, coord in self._pincode_coords.items():
-                if pc.startswith(prefix):
-                    return GeoResult(
-                        latitude=coord[0],
-                        longitude=coord[1],
-                        source="pincode_prefix",
-                        precision="city",
-                        uncertainty_km=20.0,  # Less precise
-                    )
+            return self._geocode_by_pincode_prefix(pincode[:3])
         
         return None
     
+    def _geocode_by_pincode_prefix(self, prefix: str) -> Optional[GeoResult]:
+        """Coordinates of the first known pincode sharing a 3-digit prefix."""
+        for pc, coord in self._pincode_coords.items():
+            if pc.startswith(prefix):
+                return GeoResult(
+                    latitude=coord[0],
+                    longitude=coord[1],
+                    source="pincode_prefix",
+                    precision="city",
+                    uncertainty_km=20.0,  # Less precise
+                )
+        
+        return None
+    
+    def geocode_batch(
+        self,
+        cases: List[Tuple[str, Optional[str]]],
+    ) -> List[Dict]:
+        """
+        Geocode many (normalized_text, pincode) pairs.
+        
+        Cases are grouped by 3-digit pincode prefix so the prefix fallback
+        (a scan of the centroid table) runs at most once per prefix instead
+        of once per address. Anything the pincode cannot resolve goes
+        through the regular geocode() hierarchy.
+        
+        Args:
+            cases: Sequence of (normalized_text, pincode) pairs; pincode
+                may be None
+            
+        Returns:
+            List of result dicts in input order, same format as geocode()
+        """
+        results: List[Optional[Dict]] = [None] * len(cases)
+        
+        def prefix_of(i: int) -> str:
+            pincode = cases[i][1]
+            return pincode[:3] if pincode and validate_pincode(pincode) else ""
+        
+        for prefix, group in groupby(sorted(range(len(cases)), key=prefix_of), key=prefix_of):
+            prefix_result = None
+            prefix_resolved = False
+            
+            for i in group:
+                text, pincode = cases[i]
+                
+                if prefix:
+                    coords = self._pincode_coords.get(pincode)
+                    if coords:
+                        results[i] = GeoResult(
+                            latitude=coords[0],
+                            longitude=coords[1],
+                            source="pincode",
+                            precision="locality",
+                            uncertainty_km=5.0,
+                        ).to_dict()
+                        continue
+                    
+                    # One prefix scan per group
+                    if not prefix_resolved:
+                        prefix_result = self._geocode_by_pincode_prefix(prefix)
+                        prefix_resolved = True
+                    if prefix_result:
+                        results[i] = prefix_result.to_dict()
+                        continue
+                
+                # Pincode did not resolve; fall through the remaining methods
+                results[i] = self.geocode(text)
+        
+        return results
+    
     def _geocode_by_city(self, city: str) -> Optional[GeoResult]:
         """Look up coordinates by city name."""
         city_lower = city.lower().strip()
@@ -416,16 +480,7 @@ class ContextualGeocoder:
     
     def _extract_state_from_text(self, text: str) -> Optional[str]:
         """Try to identify state from address text."""
-        text_lower = text.lower()
-        
-        for code, info in self._states.items():
-            if info["name"].lower() in text_lower:
-                return code
-            for alias in info.get("aliases", []):
-                if f" {alias.lower()} " in f" {text_lower} ":
-                    return code
-        
-        return None
+        return find_state_in_text(text)
     
     def _get_india_fallback(self) -> GeoResult:
         """Return center of India as last-resort fallback."""
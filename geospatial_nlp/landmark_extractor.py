@@ -16,8 +16,8 @@ This avoids heavy model training while capturing most landmarks accurately.
 """
 
 import re
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from operator import attrgetter
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 # Conditional import for spaCy (optional dependency)
 try:
@@ -40,11 +40,14 @@ from .utils import load_landmark_patterns, clean_text
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass
-class ExtractedLandmark:
+class ExtractedLandmark(NamedTuple):
     """
     Represents an extracted landmark with metadata.
     
+    A NamedTuple rather than a dict: candidates stay compact records with
+    fixed fields while the extractor filters and deduplicates them, and
+    only the survivors are converted with to_dict().
+    
     Attributes:
         text: Original text span that was identified as a landmark
         category: Type of landmark (religious, transport, commercial, etc.)
@@ -74,6 +77,10 @@ class ExtractedLandmark:
         }
 
 
+# Sort key for ranking records by confidence
+_CONFIDENCE = attrgetter("confidence")
+
+
 # =============================================================================
 # PATTERN DEFINITIONS
 # =============================================================================
@@ -96,6 +103,16 @@ _POSITIONAL_RE = re.compile(
     re.IGNORECASE
 )
 
+# Per-keyword "keyword + phrase" patterns, compiled once at import.
+# Each keyword keeps its own pattern rather than joining one alternation so
+# overlapping keywords ("opp" / "opp to", "in" / "in front of") still yield
+# their own matches, in the same order as before.
+_POSITIONAL_KEYWORD_RES = tuple(
+    (position, keyword, re.compile(rf'\b{re.escape(keyword)}\s+([^,\-\n]+?)(?:[,\-]|$)'))
+    for position, keywords in POSITIONAL_PATTERNS.items()
+    for keyword in keywords
+)
+
 # Landmark type indicators with their categories
 LANDMARK_INDICATORS = {
     "religious": [
@@ -250,6 +267,21 @@ class LandmarkExtractor:
         Returns:
             List of extracted landmark dictionaries
         """
+        return [lm.to_dict() for lm in self.extract_records(text)]
+    
+    def extract_records(self, text: str) -> List[ExtractedLandmark]:
+        """
+        Extract landmarks as ExtractedLandmark records instead of dicts.
+        
+        Same results as extract(), without building a dict per landmark;
+        prefer this for bulk processing.
+        
+        Args:
+            text: Normalized address text
+            
+        Returns:
+            List of ExtractedLandmark records
+        """
         if not text:
             return []
         
@@ -276,11 +308,11 @@ class LandmarkExtractor:
         landmarks = self._deduplicate(landmarks)
         
         # Step 5: Filter by confidence
-        landmarks = [lm for lm in landmarks if lm.get("confidence", 1.0) >= self.min_confidence]
+        landmarks = [lm for lm in landmarks if lm.confidence >= self.min_confidence]
         
         return landmarks
     
-    def _extract_by_patterns(self, text_lower: str, original_text: str) -> List[Dict]:
+    def _extract_by_patterns(self, text_lower: str, original_text: str) -> List[ExtractedLandmark]:
         """
         Extract landmarks using regex patterns.
         
@@ -310,11 +342,11 @@ class LandmarkExtractor:
                     start=start,
                     end=end,
                 )
-                results.append(landmark.to_dict())
+                results.append(landmark)
         
         return results
     
-    def _extract_positional_context(self, text_lower: str, original_text: str) -> List[Dict]:
+    def _extract_positional_context(self, text_lower: str, original_text: str) -> List[ExtractedLandmark]:
         """
         Extract landmark references that follow positional keywords.
         
@@ -323,43 +355,45 @@ class LandmarkExtractor:
         """
         results = []
         
-        for position, keywords in POSITIONAL_PATTERNS.items():
-            for keyword in keywords:
-                # Pattern: keyword followed by potential landmark
-                # Capture words until delimiter (comma, hyphen, or end)
-                pattern = rf'\b{re.escape(keyword)}\s+([^,\-\n]+?)(?:[,\-]|$)'
+        for position, keyword, pattern in _POSITIONAL_KEYWORD_RES:
+            # Cheap substring check first - most keywords never occur, and
+            # this skips the regex scan for them entirely
+            if keyword not in text_lower:
+                continue
+            
+            # Pattern: keyword followed by potential landmark
+            # Capture words until delimiter (comma, hyphen, or end)
+            for match in pattern.finditer(text_lower):
+                landmark_text = match.group(1).strip()
                 
-                for match in re.finditer(pattern, text_lower):
-                    landmark_text = match.group(1).strip()
-                    
-                    # Skip if too short or looks like just a locality name
-                    if len(landmark_text) < 4:
-                        continue
-                    
-                    # Skip if it's just a number (like "near 100")
-                    if landmark_text.replace(' ', '').isdigit():
-                        continue
-                    
-                    # Get position in original text
-                    full_start = match.start()
-                    phrase_start = match.start(1)
-                    phrase_end = match.end(1)
-                    
-                    # Check if this wasn't already captured by pattern matching
-                    landmark = ExtractedLandmark(
-                        text=original_text[phrase_start:phrase_end].strip(),
-                        category="referenced",  # Unknown category, discovered by position
-                        normalized=self._normalize_landmark(landmark_text, "referenced"),
-                        position=position,
-                        confidence=0.75,  # Slightly lower confidence
-                        start=phrase_start,
-                        end=phrase_end,
-                    )
-                    results.append(landmark.to_dict())
+                # Skip if too short or looks like just a locality name
+                if len(landmark_text) < 4:
+                    continue
+                
+                # Skip if it's just a number (like "near 100")
+                if landmark_text.replace(' ', '').isdigit():
+                    continue
+                
+                # Get position in original text
+                full_start = match.start()
+                phrase_start = match.start(1)
+                phrase_end = match.end(1)
+                
+                # Check if this wasn't already captured by pattern matching
+                landmark = ExtractedLandmark(
+                    text=original_text[phrase_start:phrase_end].strip(),
+                    category="referenced",  # Unknown category, discovered by position
+                    normalized=self._normalize_landmark(landmark_text, "referenced"),
+                    position=position,
+                    confidence=0.75,  # Slightly lower confidence
+                    start=phrase_start,
+                    end=phrase_end,
+                )
+                results.append(landmark)
         
         return results
     
-    def _extract_by_ner(self, text: str) -> List[Dict]:
+    def _extract_by_ner(self, text: str) -> List[ExtractedLandmark]:
         """
         Extract entities using spaCy NER (fallback method).
         
@@ -400,7 +434,7 @@ class LandmarkExtractor:
                     start=ent.start_char,
                     end=ent.end_char,
                 )
-                results.append(landmark.to_dict())
+                results.append(landmark)
         
         return results
     
@@ -439,7 +473,11 @@ class LandmarkExtractor:
         
         return cleaned.title()
     
-    def _overlaps_existing(self, new_landmark: Dict, existing: List[Dict]) -> bool:
+    def _overlaps_existing(
+        self,
+        new_landmark: ExtractedLandmark,
+        existing: List[ExtractedLandmark],
+    ) -> bool:
         """
         Check if new landmark overlaps with any existing landmarks.
         
@@ -447,17 +485,16 @@ class LandmarkExtractor:
         (e.g., pattern match and NER both finding "Railway Station"). We use
         character offsets rather than text matching for precision.
         """
-        new_span = new_landmark.get("span", [0, 0])
+        start, end = new_landmark.start, new_landmark.end
         
         for lm in existing:
-            existing_span = lm.get("span", [0, 0])
             # Check for overlap
-            if (new_span[0] < existing_span[1] and new_span[1] > existing_span[0]):
+            if start < lm.end and end > lm.start:
                 return True
         
         return False
     
-    def _deduplicate(self, landmarks: List[Dict]) -> List[Dict]:
+    def _deduplicate(self, landmarks: List[ExtractedLandmark]) -> List[ExtractedLandmark]:
         """
         Remove duplicate landmarks, keeping higher confidence ones.
         
@@ -466,17 +503,18 @@ class LandmarkExtractor:
         both span overlap and normalized text matching to catch duplicates.
         This ensures the final output has unique, high-quality landmarks.
         """
-        if not landmarks:
-            return []
+        # Nothing to compare against (the common single-landmark address)
+        if len(landmarks) < 2:
+            return list(landmarks)
         
-        # Sort by confidence descending
-        landmarks = sorted(landmarks, key=lambda x: x.get("confidence", 0), reverse=True)
+        # Sort by confidence descending (stable, so ties keep extraction order)
+        landmarks = sorted(landmarks, key=_CONFIDENCE, reverse=True)
         
         result = []
         seen_normalized = set()
         
         for lm in landmarks:
-            normalized = lm.get("normalized", "").lower()
+            normalized = lm.normalized.lower()
             
             # Skip if we've seen this normalized form
             if normalized in seen_normalized:
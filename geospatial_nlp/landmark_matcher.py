@@ -31,6 +31,12 @@ try:
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+try:
+    import torch
+    TORCH_CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    TORCH_CUDA_AVAILABLE = False
+
 try:
     from rapidfuzz import fuzz, process
     RAPIDFUZZ_AVAILABLE = True
@@ -154,6 +160,8 @@ class LandmarkMatcher:
         # Initialize embedding model
         self._model = None
         self._embeddings: Optional[np.ndarray] = None
+        self._embeddings_t = None  # torch.Tensor on GPU, when available
+        self._device = "cuda" if TORCH_CUDA_AVAILABLE else None
         self._landmark_names: List[str] = []
         
         if self.use_embeddings and self._landmarks:
@@ -248,6 +256,10 @@ class LandmarkMatcher:
             show_progress_bar=False,
         )
         
+        # Keep a copy on the GPU so query-time similarity never leaves the device
+        if self._device:
+            self._embeddings_t = torch.from_numpy(self._embeddings).to(self._device)
+        
         print(f"Embeddings built: shape {self._embeddings.shape}")
     
     def match_landmark(
@@ -306,13 +318,6 @@ class LandmarkMatcher:
         ML Note: Cosine similarity after normalization is just a dot product.
         Higher score = more semantically similar.
         """
-        # Encode user phrase
-        query_embedding = self._model.encode(
-            user_phrase,
-            convert_to_numpy=True,
-            normalize_embeddings=True,
-        )
-        
         # Get embeddings for candidates
         candidate_names = [c.name for c in candidates]
         candidate_indices = [
@@ -323,14 +328,35 @@ class LandmarkMatcher:
         if not candidate_indices:
             return []
         
-        # Get subset of pre-computed embeddings
-        candidate_embeddings = self._embeddings[candidate_indices]
-        
-        # Compute cosine similarities (dot product since normalized)
-        similarities = np.dot(candidate_embeddings, query_embedding)
-        
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        if self._embeddings_t is not None:
+            # GPU path: dot products and top-k on device, only k scores copied back
+            query_embedding = self._model.encode(
+                user_phrase,
+                convert_to_tensor=True,
+                normalize_embeddings=True,
+            ).to(self._device)
+            index = torch.tensor(candidate_indices, device=self._device)
+            scores = self._embeddings_t[index] @ query_embedding
+            top = torch.topk(scores, k=min(top_k, len(candidate_indices)))
+            top_indices = top.indices.cpu().numpy()
+            similarities = np.zeros(len(candidate_indices), dtype=np.float32)
+            similarities[top_indices] = top.values.cpu().numpy()
+        else:
+            # Encode user phrase
+            query_embedding = self._model.encode(
+                user_phrase,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+            
+            # Get subset of pre-computed embeddings
+            candidate_embeddings = self._embeddings[candidate_indices]
+            
+            # Compute cosine similarities (dot product since normalized)
+            similarities = np.dot(candidate_embeddings, query_embedding)
+            
+            # Get top-k indices
+            top_indices = np.argsort(similarities)[::-1][:top_k]
         
         # Build results
         results = []
@@ -19,8 +19,13 @@ ML Notes:
 
 import math
 import random
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+
+import numpy as np
+
+from ._geo_njit import offset_coord_njit
 
 
 # =============================================================================
@@ -121,9 +126,49 @@ RELATIVE_DIRECTION_CONFIG = {
     },
 }
 
+# Shared read-only stand-in for a missing street_info dict
+_EMPTY: Mapping = MappingProxyType({})
+
 # Lane number to additional offset (larger lane number = further)
 LANE_OFFSET_MULTIPLIER = 15  # meters per lane number
 
+# Bearing modes as integers for the offset hot path
+MODE_RANDOM, MODE_OPPOSITE, MODE_PERPENDICULAR, MODE_FORWARD, MODE_FIXED = range(5)
+
+# Per bearing mode: (mode int, default base bearing, jitter low, jitter high).
+# "random" draws the whole bearing; "perpendicular" draws a 0-1 coin
+# that picks the left or right side of the base bearing.
+BEARING_MODES = {
+    "random": (MODE_RANDOM, 0, 0, 360),
+    "opposite": (MODE_OPPOSITE, 180, -30, 30),
+    "backward": (MODE_OPPOSITE, 180, -30, 30),
+    "perpendicular": (MODE_PERPENDICULAR, 90, 0, 1),
+    "forward": (MODE_FORWARD, 0, -20, 20),
+    "fixed": (MODE_FIXED, 0, 0, 0),
+}
+
+
+def _build_direction_table() -> Dict[str, Tuple[float, float, int, float, float, float]]:
+    """Flatten RELATIVE_DIRECTION_CONFIG into positional tuples."""
+    table = {}
+    for direction, config in RELATIVE_DIRECTION_CONFIG.items():
+        mode, default_base, jitter_low, jitter_high = BEARING_MODES.get(
+            config["bearing_mode"], BEARING_MODES["fixed"]
+        )
+        table[direction] = (
+            config["min_offset_m"],
+            config["max_offset_m"],
+            mode,
+            config.get("base_bearing", default_base),
+            jitter_low,
+            jitter_high,
+        )
+    return table
+
+
+# direction -> (min_m, max_m, mode, base_bearing, jitter_low, jitter_high)
+_DIR_TABLE = _build_direction_table()
+
 
 # =============================================================================
 # GEOSPATIAL UTILITIES
@@ -191,42 +236,109 @@ def offset_coordinate(
     return (math.degrees(new_lat_rad), math.degrees(new_lon_rad))
 
 
-def random_bearing() -> float:
-    """Generate random bearing (0-360 degrees)."""
-    return random.uniform(0, 360)
+def offset_coordinates_vec(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    bearings: np.ndarray,
+    distances: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized offset_coordinate() over arrays of points.
+    
+    Same spherical destination formula, evaluated as NumPy ufuncs so a
+    whole batch of offsets is computed without per-point Python overhead.
+    
+    Args:
+        lats: Starting latitudes
+        lons: Starting longitudes
+        bearings: Bearings in degrees (0 = north, 90 = east)
+        distances: Distances to offset in meters
+        
+    Returns:
+        Tuple of (new_lats, new_lons) arrays
+    """
+    lat_rad = np.radians(lats)
+    lon_rad = np.radians(lons)
+    bearing_rad = np.radians(bearings)
+    angular_dist = np.asarray(distances, dtype=float) / EARTH_RADIUS_M
+    
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_dist = np.sin(angular_dist)
+    cos_dist = np.cos(angular_dist)
+    
+    new_lat_rad = np.arcsin(sin_lat * cos_dist + cos_lat * sin_dist * np.cos(bearing_rad))
+    new_lon_rad = lon_rad + np.arctan2(
+        np.sin(bearing_rad) * sin_dist * cos_lat,
+        cos_dist - sin_lat * np.sin(new_lat_rad),
+    )
+    
+    return (np.degrees(new_lat_rad), np.degrees(new_lon_rad))
+
+
+def _anchor_lng(anchor: Dict) -> float:
+    """Read an anchor's longitude, accepting the alternate key names."""
+    return anchor.get("lng", anchor.get("lon", anchor.get("longitude", 0)))
+
+
+@lru_cache(maxsize=4096)
+def _primary_direction(
+    directions: Tuple[str, ...],
+    landmark_directions: Tuple[str, ...],
+) -> Optional[str]:
+    """
+    First direction word (address-level, then landmark-level) that has
+    an offset config. Memoized: the same direction tuples recur constantly.
+    """
+    for direction in directions:
+        direction_lower = direction.lower()
+        if direction_lower in RELATIVE_DIRECTION_CONFIG:
+            return direction_lower
+    
+    # Check landmarks for embedded direction
+    for lm_direction in landmark_directions:
+        lm_direction = lm_direction.lower()
+        if lm_direction in RELATIVE_DIRECTION_CONFIG:
+            return lm_direction
+    
+    return None
+
+
+def random_bearing(rng: Optional[random.Random] = None) -> float:
+    """Generate random bearing (0-360 degrees), from rng if given."""
+    return (rng or random).uniform(0, 360)
 
 
 # =============================================================================
 # PREDICTION LOGIC
 # =============================================================================
 
-@dataclass
-class PredictionResult:
+def _prediction_dict(
+    lat: float,
+    lng: float,
+    confidence: float,
+    anchor_landmark: Optional[Dict],
+    direction_used: Optional[str],
+    offset_applied_m: float,
+    bearing_applied_deg: float,
+    method: str,  # "landmark_offset", "landmark_direct", "fallback"
+) -> Dict:
     """
-    Result of location prediction.
+    Build the prediction output dict.
     
-    Contains predicted coordinates and metadata for transparency.
+    Contains predicted coordinates and metadata for transparency. Built
+    directly rather than via an intermediate result object.
     """
-    lat: float
-    lng: float
-    confidence: float
-    anchor_landmark: Optional[Dict]
-    direction_used: Optional[str]
-    offset_applied_m: float
-    bearing_applied_deg: float
-    method: str  # "landmark_offset", "landmark_direct", "fallback"
-    
-    def to_dict(self) -> Dict:
-        return {
-            "lat": round(self.lat, 6),
-            "lng": round(self.lng, 6),
-            "confidence": round(self.confidence, 3),
-            "anchor_landmark": self.anchor_landmark,
-            "direction_used": self.direction_used,
-            "offset_applied_m": round(self.offset_applied_m, 1),
-            "bearing_applied_deg": round(self.bearing_applied_deg, 1),
-            "method": self.method,
-        }
+    return {
+        "lat": round(lat, 6),
+        "lng": round(lng, 6),
+        "confidence": round(confidence, 3),
+        "anchor_landmark": anchor_landmark,
+        "direction_used": direction_used,
+        "offset_applied_m": round(offset_applied_m, 1),
+        "bearing_applied_deg": round(bearing_applied_deg, 1),
+        "method": method,
+    }
 
 
 class LocationPredictor:
@@ -262,8 +374,11 @@ class LocationPredictor:
         self.default_offset_m = default_offset_m
         self.lane_multiplier = lane_multiplier
         
-        if seed is not None:
-            random.seed(seed)
+        # Per-predictor generators, so the seed never touches global state.
+        # Single predictions draw scalars from random.Random (no array
+        # overhead); predict_batch() draws whole arrays from numpy.
+        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
     
     def predict(
         self,
@@ -278,7 +393,7 @@ class LocationPredictor:
             address_components: Dict with directions, street_info, etc.
             
         Returns:
-            PredictionResult as dictionary
+            Prediction dict (see predict_location for the format)
             
         ML Note: This is the main interface. A learned model would:
         1. Take same inputs
@@ -297,29 +412,28 @@ class LocationPredictor:
         
         # Step 2: Get direction from address components
         direction = self._get_primary_direction(address_components)
+        street_info = address_components.get("street_info") or _EMPTY
         
         # Step 3: Calculate offset parameters
         bearing, distance = self._calculate_offset(
             direction=direction,
-            address_components=address_components,
+            street_info=street_info,
         )
         
         # Step 4: Apply offset to anchor coordinates
-        new_lat, new_lng = offset_coordinate(
-            lat=anchor["lat"],
-            lon=anchor.get("lng", anchor.get("lon", anchor.get("longitude", 0))),
-            bearing_deg=bearing,
-            distance_m=distance,
+        new_lat, new_lng = offset_coord_njit(
+            anchor["lat"], _anchor_lng(anchor), bearing, distance
         )
         
         # Step 5: Calculate confidence
         confidence = self._calculate_confidence(
             anchor=anchor,
             direction=direction,
+            street_info=street_info,
             address_components=address_components,
         )
         
-        return PredictionResult(
+        return _prediction_dict(
             lat=new_lat,
             lng=new_lng,
             confidence=confidence,
@@ -328,7 +442,100 @@ class LocationPredictor:
             offset_applied_m=distance,
             bearing_applied_deg=bearing,
             method="landmark_offset" if direction else "landmark_direct",
-        ).to_dict()
+        )
+    
+    def predict_batch(
+        self,
+        matched_landmarks_list: List[List[Dict]],
+        address_components_list: List[Dict],
+    ) -> List[Dict]:
+        """
+        Predict delivery locations for a batch of addresses.
+        
+        Anchor selection and offset parameters are resolved per address,
+        then the geographic offsets for the whole batch are applied in a
+        single vectorized call (see offset_coordinates_vec).
+        
+        Random offsets are drawn per direction group from the predictor's
+        numpy generator, so they follow the same distributions as predict()
+        but are not the same draws for a given seed.
+        
+        Args:
+            matched_landmarks_list: One list of matched landmarks per address
+            address_components_list: One address components dict per address
+            
+        Returns:
+            List of prediction dicts in input order, same format as predict()
+            
+        Raises:
+            ValueError: If the two lists differ in length
+        """
+        if len(matched_landmarks_list) != len(address_components_list):
+            raise ValueError(
+                f"matched_landmarks_list has {len(matched_landmarks_list)} entries "
+                f"but address_components_list has {len(address_components_list)}"
+            )
+        
+        results: List[Optional[Dict]] = [None] * len(address_components_list)
+        rows = []  # (index, anchor, direction, street_info)
+        
+        for i, (matched_landmarks, address_components) in enumerate(
+            zip(matched_landmarks_list, address_components_list)
+        ):
+            anchor = self._select_anchor(matched_landmarks) if matched_landmarks else None
+            if not anchor or "lat" not in anchor:
+                results[i] = self._fallback_prediction(address_components)
+                continue
+            
+            direction = self._get_primary_direction(address_components)
+            street_info = address_components.get("street_info") or _EMPTY
+            rows.append((i, anchor, direction, street_info))
+        
+        if not rows:
+            return results
+        
+        n = len(rows)
+        
+        # Draw the random offsets for each direction group in one call
+        groups: Dict[Optional[str], List[int]] = {}
+        for pos, row in enumerate(rows):
+            groups.setdefault(row[2], []).append(pos)
+        
+        bearings = np.empty(n)
+        distances = np.fromiter((self._lane_offset(row[3]) for row in rows), dtype=float, count=n)
+        for direction, positions in groups.items():
+            group_bearings, group_distances = self._draw_offset_params(direction, len(positions))
+            bearings[positions] = group_bearings
+            distances[positions] += group_distances
+        
+        new_lats, new_lngs = offset_coordinates_vec(
+            lats=np.fromiter((row[1]["lat"] for row in rows), dtype=float, count=n),
+            lons=np.fromiter((_anchor_lng(row[1]) for row in rows), dtype=float, count=n),
+            bearings=bearings,
+            distances=distances,
+        )
+        
+        for (i, anchor, direction, street_info), bearing, distance, new_lat, new_lng in zip(
+            rows, bearings.tolist(), distances.tolist(), new_lats.tolist(), new_lngs.tolist()
+        ):
+            confidence = self._calculate_confidence(
+                anchor=anchor,
+                direction=direction,
+                street_info=street_info,
+                address_components=address_components_list[i],
+            )
+            results[i] = _prediction_dict(
+                lat=new_lat,
+                lng=new_lng,
+                confidence=confidence,
+                anchor_landmark=anchor,
+                direction_used=direction,
+                offset_applied_m=distance,
+                bearing_applied_deg=bearing,
+                method="landmark_offset" if direction else "landmark_direct",
+            )
+        
+        return results
     
     def _select_anchor(self, matched_landmarks: List[Dict]) -> Optional[Dict]:
         """
@@ -342,28 +549,32 @@ class LocationPredictor:
         - Landmark type (e.g., prefer buildings over areas)
         - Distance between multiple landmarks for validation
         """
-        valid_landmarks = [
-            lm for lm in matched_landmarks
-            if lm.get("lat") is not None and lm.get("similarity", 0) > 0
-        ]
-        
-        if not valid_landmarks:
-            # Try alternate key names
-            valid_landmarks = [
-                lm for lm in matched_landmarks
-                if lm.get("latitude") is not None
-            ]
-            # Normalize key names
-            for lm in valid_landmarks:
-                if "latitude" in lm:
-                    lm["lat"] = lm["latitude"]
-                if "longitude" in lm:
-                    lm["lng"] = lm["longitude"]
+        # Single pass: track the best landmark with coordinates inline
+        best = None
+        best_similarity = 0
+        for lm in matched_landmarks:
+            similarity = lm.get("similarity", 0)
+            if similarity > best_similarity and lm.get("lat") is not None:
+                best_similarity, best = similarity, lm
+        
+        if best is not None:
+            return best
+        
+        # LandmarkMatcher output always uses lat/lng; alternate key names
+        # only show up from other callers, so check them on a miss only
+        valid_landmarks = []
+        for lm in matched_landmarks:
+            if lm.get("latitude") is None:
+                continue
+            # Normalize key names on a copy, leaving the caller's dict untouched
+            anchor = {**lm, "lat": lm["latitude"]}
+            if "longitude" in lm:
+                anchor["lng"] = lm["longitude"]
+            valid_landmarks.append(anchor)
         
         if not valid_landmarks:
             return None
         
-        # Sort by similarity descending
         return max(valid_landmarks, key=lambda x: x.get("similarity", 0.5))
     
     def _get_primary_direction(self, address_components: Dict) -> Optional[str]:
@@ -372,26 +583,65 @@ class LocationPredictor:
         
         Returns the first direction that has a defined offset config.
         """
-        directions = address_components.get("directions", [])
+        landmarks = address_components.get("landmarks") or ()
+        return _primary_direction(
+            tuple(address_components.get("directions") or ()),
+            tuple(lm.get("direction", "") for lm in landmarks),
+        )
+    
+    def _lane_offset(self, street_info: Mapping) -> float:
+        """Extra offset in meters implied by the first lane number, if any."""
+        street_numbers = street_info.get("street_numbers", [])
         
-        for direction in directions:
-            direction_lower = direction.lower()
-            if direction_lower in RELATIVE_DIRECTION_CONFIG:
-                return direction_lower
+        if street_numbers:
+            # Use first lane number found
+            try:
+                lane_num = int(street_numbers[0].get("number", 0))
+                return lane_num * self.lane_multiplier
+            except (ValueError, TypeError):
+                pass
         
-        # Check landmarks for embedded direction
-        landmarks = address_components.get("landmarks", [])
-        for lm in landmarks:
-            lm_direction = lm.get("direction", "").lower()
-            if lm_direction in RELATIVE_DIRECTION_CONFIG:
-                return lm_direction
+        return 0
+    
+    def _draw_offset_params(
+        self,
+        direction: Optional[str],
+        n: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draw n random (bearing, base distance) pairs for a direction.
+        
+        Distances and bearing jitter come from a single self._rng.uniform
+        call, so a batch of n offsets costs one RNG round-trip. Lane
+        offsets are not included.
+        
+        Returns:
+            Tuple of (bearings_degrees, distances_meters) arrays
+        """
+        entry = _DIR_TABLE.get(direction) if direction else None
+        
+        if entry is None:
+            # Default: random direction, default offset
+            draws = self._rng.uniform(
+                [self.default_offset_m, 0], [self.default_offset_m, 360], size=(n, 2)
+            )
+            return (draws[:, 1], draws[:, 0])
         
-        return None
+        min_m, max_m, mode, base_bearing, jitter_low, jitter_high = entry
+        draws = self._rng.uniform([min_m, jitter_low], [max_m, jitter_high], size=(n, 2))
+        
+        if mode == MODE_PERPENDICULAR:
+            # Choose left or right randomly
+            bearings = np.where(draws[:, 1] > 0.5, 360 - base_bearing, base_bearing)
+        else:
+            bearings = base_bearing + draws[:, 1]
+        
+        return (bearings % 360, draws[:, 0])
     
     def _calculate_offset(
         self,
         direction: Optional[str],
-        address_components: Dict,
+        street_info: Mapping,
     ) -> Tuple[float, float]:
         """
         Calculate bearing and distance for offset.
@@ -401,57 +651,31 @@ class LocationPredictor:
         Returns:
             Tuple of (bearing_degrees, distance_meters)
         """
-        # Get lane number adjustment
-        lane_offset = 0
-        street_info = address_components.get("street_info", {})
-        street_numbers = street_info.get("street_numbers", [])
+        lane_offset = self._lane_offset(street_info)
+        entry = _DIR_TABLE.get(direction) if direction else None
+        uniform = self._random.uniform
         
-        if street_numbers:
-            # Use first lane number found
-            try:
-                lane_num = int(street_numbers[0].get("number", 0))
-                lane_offset = lane_num * self.lane_multiplier
-            except (ValueError, TypeError):
-                pass
+        if entry is None:
+            # Default: random direction, default offset
+            return (random_bearing(self._random), self.default_offset_m + lane_offset)
         
-        # Get direction-based offset
-        if direction and direction in RELATIVE_DIRECTION_CONFIG:
-            config = RELATIVE_DIRECTION_CONFIG[direction]
-            
-            # Calculate distance
-            min_offset = config["min_offset_m"]
-            max_offset = config["max_offset_m"]
-            base_distance = random.uniform(min_offset, max_offset)
-            total_distance = base_distance + lane_offset
-            
-            # Calculate bearing
-            bearing_mode = config["bearing_mode"]
-            if bearing_mode == "random":
-                bearing = random_bearing()
-            elif bearing_mode in ("opposite", "backward"):
-                bearing = config.get("base_bearing", 180)
-                # Add some randomness (±30 degrees)
-                bearing += random.uniform(-30, 30)
-            elif bearing_mode == "perpendicular":
-                # Choose left or right randomly
-                bearing = config.get("base_bearing", 90)
-                if random.random() > 0.5:
-                    bearing = 360 - bearing
-            elif bearing_mode == "forward":
-                bearing = config.get("base_bearing", 0)
-                bearing += random.uniform(-20, 20)
-            else:  # fixed
-                bearing = config.get("base_bearing", 0)
-            
-            return (bearing % 360, total_distance)
+        min_m, max_m, mode, base_bearing, jitter_low, jitter_high = entry
+        distance = uniform(min_m, max_m) + lane_offset
+        jitter = uniform(jitter_low, jitter_high)
         
-        # Default: random direction, default offset
-        return (random_bearing(), self.default_offset_m + lane_offset)
+        if mode == MODE_PERPENDICULAR:
+            # Choose left or right randomly
+            bearing = 360 - base_bearing if jitter > 0.5 else base_bearing
+        else:
+            bearing = base_bearing + jitter
+        
+        return (bearing % 360, distance)
     
     def _calculate_confidence(
         self,
         anchor: Dict,
         direction: Optional[str],
+        street_info: Mapping,
         address_components: Dict,
     ) -> float:
         """
@@ -470,7 +694,6 @@ class LocationPredictor:
             base_confidence += 0.1
         
         # Lane/building number bonus
-        street_info = address_components.get("street_info", {})
         if street_info.get("street_numbers"):
             base_confidence += 0.05
         if street_info.get("building_numbers"):
@@ -489,7 +712,7 @@ class LocationPredictor:
         
         Returns empty prediction with low confidence.
         """
-        return PredictionResult(
+        return _prediction_dict(
             lat=0.0,
             lng=0.0,
             confidence=0.0,
@@ -498,7 +721,7 @@ class LocationPredictor:
             offset_applied_m=0,
             bearing_applied_deg=0,
             method="fallback",
-        ).to_dict()
+        )
 
 
 # =============================================================================
@@ -13,13 +13,14 @@ Approach: Rule-based transformations + regex patterns
 """
 
 import re
-from typing import Dict, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Tuple
 from .utils import (
     clean_text,
     normalize_whitespace,
     extract_pincode,
     resolve_state_name,
-    load_indian_states,
+    find_state_in_text,
 )
 
 
@@ -27,8 +28,11 @@ from .utils import (
 # ABBREVIATION MAPPINGS
 # =============================================================================
 
+# Tables are built once at import and exposed read-only, so every
+# normalizer (and every compiled pattern built from them) shares them safely
+
 # Common English abbreviations found in Indian addresses
-ENGLISH_ABBREVIATIONS = {
+ENGLISH_ABBREVIATIONS = MappingProxyType({
     # Directional
     "n": "north",
     "s": "south",
@@ -107,10 +111,10 @@ ENGLISH_ABBREVIATIONS = {
     "soc": "society",
     "chs": "cooperative housing society",
     "chsl": "cooperative housing society limited",
-}
+})
 
 # Hindi/Indian language transliterations commonly found in addresses
-TRANSLITERATIONS = {
+TRANSLITERATIONS = MappingProxyType({
     # Street/Lane types
     "gali": "lane",
     "gully": "lane",
@@ -175,10 +179,10 @@ TRANSLITERATIONS = {
     "dakshin": "south",
     "purv": "east",
     "paschim": "west",
-}
+})
 
 # Common city name variations and their canonical forms
-CITY_ALIASES = {
+CITY_ALIASES = MappingProxyType({
     "bombay": "mumbai",
     "madras": "chennai",
     "calcutta": "kolkata",
@@ -197,7 +201,21 @@ CITY_ALIASES = {
     "benares": "varanasi",
     "allahabad": "prayagraj",
     "gurgaon": "gurugram",
-}
+})
+
+# Directional suffixes like "(e)" in "andheri (e)"
+DIRECTION_SUFFIXES = {"e": "east", "w": "west", "n": "north", "s": "south"}
+
+# Major cities recognized in normalized text (canonical names)
+MAJOR_CITIES = (
+    "mumbai", "delhi", "bengaluru", "chennai", "kolkata",
+    "hyderabad", "pune", "ahmedabad", "surat", "jaipur",
+    "lucknow", "kanpur", "nagpur", "indore", "thane",
+    "bhopal", "visakhapatnam", "patna", "vadodara", "ghaziabad",
+    "ludhiana", "agra", "nashik", "faridabad", "meerut",
+    "rajkot", "varanasi", "srinagar", "aurangabad", "dhanbad",
+    "amritsar", "navi mumbai", "noida", "gurugram", "guwahati",
+)
 
 
 # =============================================================================
@@ -246,30 +264,49 @@ class AddressNormalizer:
     
     def _compile_patterns(self):
         """Pre-compile regex patterns for better performance."""
-        # Pattern to match abbreviations as whole words
+        # Abbreviations, transliterations and city aliases are merged into
+        # one alternation so the text is scanned once. Each table gets its
+        # own named group; the group that matched selects the lookup table.
         # Uses word boundaries to avoid partial matches
-        abbrev_pattern = r'\b(' + '|'.join(
-            re.escape(k) for k in sorted(ENGLISH_ABBREVIATIONS.keys(), key=len, reverse=True)
-        ) + r')\.?\b'
-        self._abbrev_re = re.compile(abbrev_pattern, re.IGNORECASE)
+        self._replacement_tables = {}
+        alternatives = []
+        if self.expand_abbreviations:
+            self._replacement_tables["abbrev"] = ENGLISH_ABBREVIATIONS
+            # Abbreviations may carry a trailing period ("rd.", "opp.")
+            alternatives.append(r'(?P<abbrev>' + self._alternation(ENGLISH_ABBREVIATIONS) + r')\.?')
+        if self.translate_hindi:
+            self._replacement_tables["trans"] = TRANSLITERATIONS
+            alternatives.append(r'(?P<trans>' + self._alternation(TRANSLITERATIONS) + r')')
+        if self.normalize_cities:
+            self._replacement_tables["city"] = CITY_ALIASES
+            alternatives.append(r'(?P<city>' + self._alternation(CITY_ALIASES) + r')')
         
-        # Pattern for transliterations
-        trans_pattern = r'\b(' + '|'.join(
-            re.escape(k) for k in sorted(TRANSLITERATIONS.keys(), key=len, reverse=True)
-        ) + r')\b'
-        self._trans_re = re.compile(trans_pattern, re.IGNORECASE)
+        # Bound dict.get per group, so the sub() callback skips attribute lookups
+        self._replacement_getters = {
+            group: table.get for group, table in self._replacement_tables.items()
+        }
         
-        # Pattern for city aliases
-        city_pattern = r'\b(' + '|'.join(
-            re.escape(k) for k in sorted(CITY_ALIASES.keys(), key=len, reverse=True)
-        ) + r')\b'
-        self._city_re = re.compile(city_pattern, re.IGNORECASE)
+        self._replace_re = None
+        if alternatives:
+            self._replace_re = re.compile(
+                r'\b(?:' + '|'.join(alternatives) + r')\b',
+                re.IGNORECASE
+            )
+        
+        # Major cities, longest first so "navi mumbai" wins over "mumbai"
+        self._major_city_re = re.compile(
+            r'\b(' + '|'.join(
+                re.escape(c) for c in sorted(MAJOR_CITIES, key=len, reverse=True)
+            ) + r')\b'
+        )
         
-        # Pattern for directional suffixes like (E), (W), (N), (S)
-        self._direction_suffix_re = re.compile(r'\(([ewns])\)', re.IGNORECASE)
+        # Pattern for directional suffixes like (e), (w), (n), (s). Runs
+        # after clean_text(), so the text is already lowercase
+        self._direction_suffix_re = re.compile(r'\(([ewns])\)')
         
-        # Pattern for duplicate/noisy punctuation
-        self._noise_re = re.compile(r'[,\.\-]{2,}')
+        # Pattern for duplicate/noisy punctuation; the first character of
+        # the run is captured so sub() can use a template, not a callback
+        self._noise_re = re.compile(r'([,\.\-])[,\.\-]+')
         
         # Pattern for state extraction at end of address
         # Common patterns: "Maharashtra", "MH", "State: Maharashtra"
@@ -278,6 +315,11 @@ class AddressNormalizer:
             re.IGNORECASE
         )
     
+    @staticmethod
+    def _alternation(table: Mapping[str, str]) -> str:
+        """Build a regex alternation of table keys, longest first."""
+        return '|'.join(re.escape(k) for k in sorted(table.keys(), key=len, reverse=True))
+    
     def normalize(self, address: str) -> Dict[str, Optional[str]]:
         """
         Normalize an address and extract components.
@@ -315,17 +357,10 @@ class AddressNormalizer:
         # Step 3: Expand directional suffixes like (E) -> East
         text = self._expand_direction_suffixes(text)
         
-        # Step 4: Expand English abbreviations
-        if self.expand_abbreviations:
-            text = self._expand_abbreviations(text)
-        
-        # Step 5: Handle Hindi transliterations
-        if self.translate_hindi:
-            text = self._handle_transliterations(text)
-        
-        # Step 6: Normalize city names
-        if self.normalize_cities:
-            text = self._normalize_city_names(text)
+        # Steps 4-6: Expand English abbreviations, handle Hindi
+        # transliterations and normalize city names (single pass)
+        if self._replace_re is not None:
+            text = self._expand_replacements(text)
         
         # Step 7: Clean up noise
         text = self._clean_noise(text)
@@ -354,54 +389,35 @@ class AddressNormalizer:
         
         Common in Mumbai addresses: "Andheri (E)" means Andheri East
         """
-        direction_map = {'e': 'east', 'w': 'west', 'n': 'north', 's': 'south'}
+        if '(' not in text:
+            return text
         
-        def replace_direction(match):
-            d = match.group(1).lower()
-            return direction_map.get(d, match.group(0))
-        
-        return self._direction_suffix_re.sub(replace_direction, text)
+        suffixes = DIRECTION_SUFFIXES
+        return self._direction_suffix_re.sub(lambda m: suffixes[m.group(1)], text)
     
-    def _expand_abbreviations(self, text: str) -> str:
+    def _expand_replacements(self, text: str) -> str:
         """
-        Expand common English abbreviations.
+        Expand abbreviations, transliterations and old city names.
         
-        Uses word boundaries to avoid partial replacements.
-        Handles both with and without trailing periods.
-        """
-        def replace_abbrev(match):
-            abbrev = match.group(1).lower()
-            return ENGLISH_ABBREVIATIONS.get(abbrev, match.group(0))
+        - Abbreviations: Rd -> road, Opp -> opposite (trailing period allowed)
+        - Hindi transliterations: gali -> lane, mandir -> temple
+        - City names: Bombay -> mumbai, Madras -> chennai
         
-        return self._abbrev_re.sub(replace_abbrev, text)
-    
-    def _handle_transliterations(self, text: str) -> str:
+        For MVP, transliterations are translated directly without keeping
+        the original term.
         """
-        Optionally translate Hindi transliterations.
-        
-        Note: We keep the original term in parentheses for context,
-        e.g., "gali" -> "lane (gali)" since the Hindi term might be
-        useful for landmark matching.
-        
-        For MVP, we just translate directly without keeping original.
-        """
-        def replace_trans(match):
-            term = match.group(1).lower()
-            return TRANSLITERATIONS.get(term, match.group(0))
-        
-        return self._trans_re.sub(replace_trans, text)
-    
-    def _normalize_city_names(self, text: str) -> str:
-        """
-        Update old city names to current official names.
-        
-        e.g., Bombay -> Mumbai, Madras -> Chennai
-        """
-        def replace_city(match):
-            city = match.group(1).lower()
-            return CITY_ALIASES.get(city, match.group(0))
-        
-        return self._city_re.sub(replace_city, text)
+        getters = self._replacement_getters
+        lower = str.lower
+        
+        def replace(match):
+            group = match.lastgroup
+            key = match.group(group)
+            get = getters[group]
+            # Table keys are lowercase and so is text from clean_text(), so
+            # the direct lookup almost always hits without allocating
+            return get(key) or get(lower(key), match.group(0))
+        
+        return self._replace_re.sub(replace, text)
     
     def _clean_noise(self, text: str) -> str:
         """
@@ -412,14 +428,12 @@ class AddressNormalizer:
         - Excessive commas
         """
         # Replace multiple punctuation with single
-        text = self._noise_re.sub(lambda m: m.group(0)[0], text)
-        
-        # Remove leading/trailing punctuation from segments
-        segments = text.split(',')
-        segments = [s.strip(' .,;:-') for s in segments if s.strip()]
-        text = ', '.join(segments)
+        text = self._noise_re.sub(r'\1', text)
         
-        return text
+        # Remove leading/trailing punctuation from segments; segments left
+        # empty (pure punctuation) are dropped
+        segments = [s.strip(' .,;:-') for s in text.split(',')]
+        return ', '.join(filter(None, segments))
     
     def _extract_state(self, text: str) -> Optional[str]:
         """
@@ -431,21 +445,8 @@ class AddressNormalizer:
         # 1. At the end: "..., Maharashtra"
         # 2. With pincode: "Mumbai 400001 Maharashtra"
         # 3. As code: "MH" or "maha"
-        
-        states = load_indian_states()
-        text_lower = text.lower()
-        
-        # Check each state's name and aliases
-        for code, info in states.items():
-            # Check full name
-            if info["name"].lower() in text_lower:
-                return code
-            # Check aliases
-            for alias in info.get("aliases", []):
-                if f" {alias.lower()} " in f" {text_lower} ":
-                    return code
-        
-        return None
+        # The first state whose name or alias appears wins
+        return find_state_in_text(text)
     
     def _extract_city(self, text: str) -> Optional[str]:
         """
@@ -453,29 +454,20 @@ class AddressNormalizer:
         
         Returns the canonical city name if identified.
         """
-        # First check for normalized city names (already in text after normalization)
-        major_cities = [
-            "mumbai", "delhi", "bengaluru", "chennai", "kolkata",
-            "hyderabad", "pune", "ahmedabad", "surat", "jaipur",
-            "lucknow", "kanpur", "nagpur", "indore", "thane",
-            "bhopal", "visakhapatnam", "patna", "vadodara", "ghaziabad",
-            "ludhiana", "agra", "nashik", "faridabad", "meerut",
-            "rajkot", "varanasi", "srinagar", "aurangabad", "dhanbad",
-            "amritsar", "navi mumbai", "noida", "gurugram", "guwahati",
-        ]
-        
-        text_lower = text.lower()
-        for city in major_cities:
-            if city in text_lower:
-                return city.title()
-        
-        return None
+        # City names are already canonical in the text after normalization
+        m = self._major_city_re.search(text.lower())
+        return m.group(1).title() if m else None
 
 
 # =============================================================================
 # CONVENIENCE FUNCTION
 # =============================================================================
 
+# Normalizer instances keyed by their options, so repeated calls reuse the
+# compiled patterns instead of rebuilding them per address
+_normalizer_cache: Dict[frozenset, AddressNormalizer] = {}
+
+
 def normalize_address(address: str, **kwargs) -> Dict[str, Optional[str]]:
     """
     Convenience function to normalize an address.
@@ -487,5 +479,10 @@ def normalize_address(address: str, **kwargs) -> Dict[str, Optional[str]]:
     Returns:
         Normalized address dict with text and extracted components
     """
-    normalizer = AddressNormalizer(**kwargs)
+    key = frozenset(kwargs.items())
+    normalizer = _normalizer_cache.get(key)
+    
+    if normalizer is None:
+        normalizer = _normalizer_cache.setdefault(key, AddressNormalizer(**kwargs))
+    
     return normalizer.normalize(address)
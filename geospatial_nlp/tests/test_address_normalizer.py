@@ -0,0 +1,84 @@
+"""
+Tests for the address_normalizer text helpers.
+
+Tests cover:
+- Abbreviation expansion with the default and custom maps
+- Case-folded (non-ASCII) abbreviation matches
+"""
+
+import random
+import re
+
+import pytest
+
+from geospatial_nlp.address_normalizer import ABBREVIATION_MAP, expand_abbreviations
+
+
+# Characters re.IGNORECASE treats as case variants of ASCII letters
+# whose lower() is something else: long s and the Kelvin sign
+_FOLDED = {"s": "ſ", "k": "K"}
+
+
+def _folded(abbrev):
+    """Replace each s/k with its non-ASCII case-folding variant."""
+    return "".join(_FOLDED.get(ch, ch) for ch in abbrev)
+
+
+class TestExpandAbbreviations:
+    """Test suite for expand_abbreviations()."""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("12 MG Rd", "12 MG road"),
+        ("nr city mall opp sbi", "near city mall opposite sbi"),
+        ("Main St.", "Main street."),
+        ("b/h station rd.", "behind station road."),
+        ("standard chartered", "standard chartered"),
+        ("", ""),
+    ])
+    def test_default_map(self, text, expected):
+        """Test common expansions and that partial words are left alone."""
+        assert expand_abbreviations(text) == expected
+    
+    @pytest.mark.parametrize("abbrev", sorted(ABBREVIATION_MAP))
+    def test_every_default_abbreviation(self, abbrev):
+        """Test each default abbreviation as written and upper-cased."""
+        expansion = ABBREVIATION_MAP[abbrev]
+        
+        for variant in (abbrev, abbrev.upper()):
+            assert expand_abbreviations(f"alpha {variant} omega") == f"alpha {expansion} omega"
+    
+    def test_custom_map(self):
+        """Test custom entries are added and override the defaults."""
+        custom = {"Mkt": "bazaar", "xrd": "cross road"}
+        
+        assert expand_abbreviations("MKT near xrd", custom) == "bazaar near cross road"
+        assert expand_abbreviations("old mkt", custom) == "old bazaar"
+        # Defaults still apply alongside the custom entries
+        assert expand_abbreviations("opp xrd", custom) == "opposite cross road"
+    
+    @pytest.mark.parametrize("abbrev", sorted(a for a in ABBREVIATION_MAP if set(a) & set(_FOLDED)))
+    def test_case_folded_match(self, abbrev):
+        """Test that matches whose lower() is not a key still expand."""
+        text = f"main {_folded(abbrev)}"
+        
+        assert expand_abbreviations(text) == f"main {ABBREVIATION_MAP[abbrev]}"
+    
+    def test_case_folded_custom_map(self):
+        """Test case-folded matches against custom entries."""
+        assert expand_abbreviations("Kothi ſq", {"kothi": "house", "sq": "square"}) == "house square"
+    
+    def test_never_raises_on_random_text(self):
+        """Test random mixes of abbreviations and folded variants."""
+        rng = random.Random(0)
+        tokens = list(ABBREVIATION_MAP) + [_folded(a) for a in ABBREVIATION_MAP] + ["main", "été", "42"]
+        
+        for _ in range(500):
+            words = [rng.choice(tokens) for _ in range(rng.randint(1, 6))]
+            text = " ".join(w.upper() if rng.random() < 0.3 else w for w in words)
+            result = expand_abbreviations(text, {"sq": "square"} if rng.random() < 0.5 else None)
+            assert isinstance(result, str)
+            assert not re.search(r"\s{2}", result)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
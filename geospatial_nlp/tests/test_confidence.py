@@ -9,37 +9,34 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from geospatial_nlp.confidence import ConfidenceScorer, calculate_confidence
 
 
+@pytest.fixture(scope="module")
+def scorer():
+    """Shared scorer for the module; score() does not mutate it."""
+    return ConfidenceScorer()
+
+
 class TestConfidenceScorer:
     """Test suite for ConfidenceScorer class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.scorer = ConfidenceScorer()
-    
     # -------------------------------------------------------------------------
     # Component Scoring Tests
     # -------------------------------------------------------------------------
     
-    def test_score_with_pincode(self):
+    def test_score_with_pincode(self, scorer):
         """Test that pincode presence increases score."""
         # With pincode
-        result_with = self.scorer.score(
+        result_with = scorer.score(
             normalized={"pincode": "400001", "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "pincode", "precision": "locality"}
         )
         
         # Without pincode
-        result_without = self.scorer.score(
+        result_without = scorer.score(
             normalized={"pincode": None, "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "country_fallback", "precision": "country"}
@@ -47,9 +44,9 @@ class TestConfidenceScorer:
         
         assert result_with["score"] > result_without["score"]
     
-    def test_score_with_city(self):
+    def test_score_with_city(self, scorer):
         """Test that city identification improves score."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": "400001", "city": "Mumbai", "state": "MH"},
             landmarks=[],
             geo_result={"source": "pincode", "precision": "locality"}
@@ -58,14 +55,14 @@ class TestConfidenceScorer:
         # City component should be positive
         assert result["components"]["city"] > 0.5
     
-    def test_score_with_landmarks(self):
+    def test_score_with_landmarks(self, scorer):
         """Test that landmarks improve score."""
         landmarks = [
             {"text": "Shiv Temple", "category": "religious", "confidence": 0.9},
             {"text": "Railway Station", "category": "transport", "confidence": 0.85},
         ]
         
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": "400001", "city": "Mumbai", "state": "MH"},
             landmarks=landmarks,
             geo_result={"source": "pincode", "precision": "locality"}
@@ -78,15 +75,15 @@ class TestConfidenceScorer:
     # Source-Based Scoring Tests
     # -------------------------------------------------------------------------
     
-    def test_pincode_source_highest_score(self):
+    def test_pincode_source_highest_score(self, scorer):
         """Test that pincode source gets highest base score."""
-        result_pincode = self.scorer.score(
+        result_pincode = scorer.score(
             normalized={"pincode": "400001", "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "pincode", "precision": "locality"}
         )
         
-        result_city = self.scorer.score(
+        result_city = scorer.score(
             normalized={"pincode": None, "city": "Mumbai", "state": None},
             landmarks=[],
             geo_result={"source": "city", "precision": "city"}
@@ -94,9 +91,9 @@ class TestConfidenceScorer:
         
         assert result_pincode["score"] > result_city["score"]
     
-    def test_fallback_source_lowest_score(self):
+    def test_fallback_source_lowest_score(self, scorer):
         """Test that fallback source gets lowest score."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": None, "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "country_fallback", "precision": "country"}
@@ -109,9 +106,9 @@ class TestConfidenceScorer:
     # Confidence Level Tests
     # -------------------------------------------------------------------------
     
-    def test_high_confidence_level(self):
+    def test_high_confidence_level(self, scorer):
         """Test high confidence level assignment."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": "400001", "city": "Mumbai", "state": "MH"},
             landmarks=[
                 {"text": "Temple", "category": "religious", "confidence": 0.9},
@@ -122,9 +119,9 @@ class TestConfidenceScorer:
         assert result["level"] == "high"
         assert result["score"] >= 0.85
     
-    def test_medium_confidence_level(self):
+    def test_medium_confidence_level(self, scorer):
         """Test medium confidence level range."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": None, "city": "Mumbai", "state": "MH"},
             landmarks=[],
             geo_result={"source": "city", "precision": "city"}
@@ -133,9 +130,9 @@ class TestConfidenceScorer:
         # City-based should be medium confidence
         assert result["level"] in ["medium", "high"]
     
-    def test_low_confidence_level(self):
+    def test_low_confidence_level(self, scorer):
         """Test low confidence level assignment."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": None, "city": None, "state": "MH"},
             landmarks=[],
             geo_result={"source": "state", "precision": "state"}
@@ -143,9 +140,9 @@ class TestConfidenceScorer:
         
         assert result["level"] in ["low", "very_low"]
     
-    def test_very_low_confidence_level(self):
+    def test_very_low_confidence_level(self, scorer):
         """Test very low confidence level assignment."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": None, "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "country_fallback", "precision": "country"}
@@ -158,14 +155,14 @@ class TestConfidenceScorer:
     # Adjustment Tests
     # -------------------------------------------------------------------------
     
-    def test_multiple_landmarks_bonus(self):
+    def test_multiple_landmarks_bonus(self, scorer):
         """Test that multiple landmarks get bonus adjustment."""
         landmarks = [
             {"text": "Temple", "category": "religious", "confidence": 0.9},
             {"text": "Station", "category": "transport", "confidence": 0.85},
         ]
         
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": "400001", "city": None, "state": None},
             landmarks=landmarks,
             geo_result={"source": "pincode", "precision": "locality"}
@@ -175,9 +172,9 @@ class TestConfidenceScorer:
         assert "multiple_landmarks" in result["adjustments"]
         assert result["adjustments"]["multiple_landmarks"] > 0
     
-    def test_building_number_bonus(self):
+    def test_building_number_bonus(self, scorer):
         """Test that building numbers get bonus."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={
                 "pincode": "400001",
                 "city": "Mumbai",
@@ -196,10 +193,10 @@ class TestConfidenceScorer:
     # Score Bounds Tests
     # -------------------------------------------------------------------------
     
-    def test_score_bounded_above(self):
+    def test_score_bounded_above(self, scorer):
         """Test that score never exceeds 0.99."""
         # Perfect case
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": "400001", "city": "Mumbai", "state": "MH"},
             landmarks=[
                 {"text": "1", "confidence": 1.0},
@@ -211,10 +208,10 @@ class TestConfidenceScorer:
         
         assert result["score"] <= 0.99
     
-    def test_score_bounded_below(self):
+    def test_score_bounded_below(self, scorer):
         """Test that score never goes below 0.05."""
         # Worst case
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": None, "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "country_fallback", "precision": "country"}
@@ -226,9 +223,9 @@ class TestConfidenceScorer:
     # Interpretation Tests
     # -------------------------------------------------------------------------
     
-    def test_interpretation_present(self):
+    def test_interpretation_present(self, scorer):
         """Test that interpretation is always present."""
-        result = self.scorer.score(
+        result = scorer.score(
             normalized={"pincode": "400001", "city": None, "state": None},
             landmarks=[],
             geo_result={"source": "pincode", "precision": "locality"}
@@ -8,69 +8,54 @@ Tests cover:
 - Uncertainty estimation
 """
 
+import numpy as np
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from geospatial_nlp.geocoder import ContextualGeocoder, geocode_address
 
 
+# (normalized_text, pincode) cases that must geocode inside India
+_INDIA_CASES = (
+    ("Mumbai", "400001"),
+    ("Delhi", "110001"),
+    ("Chennai", None),
+    ("Random Place", None),
+)
+
+
+@pytest.fixture(scope="module")
+def geocoder():
+    """Shared geocoder for the module; geocode() does not mutate it."""
+    return ContextualGeocoder(use_external_api=False)
+
+
 class TestContextualGeocoder:
     """Test suite for ContextualGeocoder class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.geocoder = ContextualGeocoder(use_external_api=False)
-    
     # -------------------------------------------------------------------------
     # Pincode Geocoding Tests
     # -------------------------------------------------------------------------
     
-    def test_geocode_by_pincode_mumbai(self):
-        """Test geocoding with Mumbai pincode."""
-        result = self.geocoder.geocode(
-            normalized_text="Andheri East",
-            pincode="400069"
-        )
-        
-        assert result["source"] == "pincode"
-        assert result["coordinates"]["lat"] is not None
-        assert result["coordinates"]["lon"] is not None
-        # Should be near Mumbai (lat ~19, lon ~72)
-        assert 18.5 < result["coordinates"]["lat"] < 20.0
-        assert 72.5 < result["coordinates"]["lon"] < 73.5
-    
-    def test_geocode_by_pincode_delhi(self):
-        """Test geocoding with Delhi pincode."""
-        result = self.geocoder.geocode(
-            normalized_text="Connaught Place",
-            pincode="110001"
-        )
+    @pytest.mark.parametrize("text,pincode,lat_rng,lon_rng", [
+        # Mumbai (lat ~19, lon ~72)
+        ("Andheri East", "400069", (18.5, 20.0), (72.5, 73.5)),
+        # Delhi (lat ~28, lon ~77)
+        ("Connaught Place", "110001", (28.0, 29.0), (77.0, 78.0)),
+        # Bengaluru (lat ~13, lon ~77)
+        ("MG Road", "560001", (12.5, 13.5), (77.0, 78.0)),
+    ])
+    def test_geocode_by_pincode(self, geocoder, text, pincode, lat_rng, lon_rng):
+        """Test geocoding with a known pincode lands near its city."""
+        result = geocoder.geocode(normalized_text=text, pincode=pincode)
         
         assert result["source"] == "pincode"
-        # Should be near Delhi (lat ~28, lon ~77)
-        assert 28.0 < result["coordinates"]["lat"] < 29.0
-        assert 77.0 < result["coordinates"]["lon"] < 78.0
-    
-    def test_geocode_by_pincode_bengaluru(self):
-        """Test geocoding with Bengaluru pincode."""
-        result = self.geocoder.geocode(
-            normalized_text="MG Road",
-            pincode="560001"
-        )
-        
-        assert result["source"] == "pincode"
-        # Should be near Bengaluru (lat ~13, lon ~77)
-        assert 12.5 < result["coordinates"]["lat"] < 13.5
-        assert 77.0 < result["coordinates"]["lon"] < 78.0
+        assert lat_rng[0] < result["coordinates"]["lat"] < lat_rng[1]
+        assert lon_rng[0] < result["coordinates"]["lon"] < lon_rng[1]
     
-    def test_geocode_pincode_prefix_fallback(self):
+    def test_geocode_pincode_prefix_fallback(self, geocoder):
         """Test fallback to pincode prefix when exact pincode not found."""
         # Use a pincode that's not in our sample data but matches prefix
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Some Area",
             pincode="400999"  # 400xxx is Mumbai region
         )
@@ -82,39 +67,26 @@ class TestContextualGeocoder:
     # City Fallback Tests
     # -------------------------------------------------------------------------
     
-    def test_geocode_by_city_mumbai(self):
+    @pytest.mark.parametrize("text", [
+        "Andheri East, Mumbai",
+        "Saket, Delhi",
+        "T Nagar, Chennai",
+    ])
+    def test_geocode_by_city(self, geocoder, text):
         """Test geocoding by city name when no pincode."""
-        result = self.geocoder.geocode(
-            normalized_text="Andheri East, Mumbai"
-        )
+        result = geocoder.geocode(normalized_text=text)
         
         # Should fall back to city
         assert result["source"] in ["city", "pincode"]
         assert result["coordinates"]["lat"] is not None
     
-    def test_geocode_by_city_delhi(self):
-        """Test geocoding by city for Delhi."""
-        result = self.geocoder.geocode(
-            normalized_text="Saket, Delhi"
-        )
-        
-        assert result["source"] in ["city", "pincode"]
-    
-    def test_geocode_by_city_chennai(self):
-        """Test geocoding by city for Chennai."""
-        result = self.geocoder.geocode(
-            normalized_text="T Nagar, Chennai"
-        )
-        
-        assert result["source"] in ["city", "pincode"]
-    
     # -------------------------------------------------------------------------
     # State Fallback Tests
     # -------------------------------------------------------------------------
     
-    def test_geocode_by_state(self):
+    def test_geocode_by_state(self, geocoder):
         """Test geocoding falls back to state when city unknown."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Some Village",
             state_hint="MH"
         )
@@ -126,9 +98,9 @@ class TestContextualGeocoder:
     # Uncertainty Tests
     # -------------------------------------------------------------------------
     
-    def test_pincode_uncertainty(self):
+    def test_pincode_uncertainty(self, geocoder):
         """Test that pincode geocoding has low uncertainty."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Andheri",
             pincode="400069"
         )
@@ -136,9 +108,9 @@ class TestContextualGeocoder:
         # Pincode should have <10km uncertainty
         assert result["uncertainty_km"] <= 10.0
     
-    def test_city_uncertainty(self):
+    def test_city_uncertainty(self, geocoder):
         """Test that city geocoding has moderate uncertainty."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Mumbai"
         )
         
@@ -146,9 +118,9 @@ class TestContextualGeocoder:
         if result["source"] == "city":
             assert result["uncertainty_km"] >= 10.0
     
-    def test_fallback_high_uncertainty(self):
+    def test_fallback_high_uncertainty(self, geocoder):
         """Test that fallback has high uncertainty."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Unknown Location"
         )
         
@@ -160,18 +132,18 @@ class TestContextualGeocoder:
     # Precision Tests
     # -------------------------------------------------------------------------
     
-    def test_pincode_precision_label(self):
+    def test_pincode_precision_label(self, geocoder):
         """Test that pincode results have 'locality' precision."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Area",
             pincode="400001"
         )
         
         assert result["precision"] == "locality"
     
-    def test_city_precision_label(self):
+    def test_city_precision_label(self, geocoder):
         """Test that city results have 'city' precision."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Some area in Mumbai"
         )
         
@@ -182,17 +154,17 @@ class TestContextualGeocoder:
     # Edge Cases
     # -------------------------------------------------------------------------
     
-    def test_empty_address(self):
+    def test_empty_address(self, geocoder):
         """Test handling of empty address."""
-        result = self.geocoder.geocode(normalized_text="")
+        result = geocoder.geocode(normalized_text="")
         
         # Should return fallback result
         assert result["coordinates"] is not None
         assert result["source"] == "country_fallback"
     
-    def test_invalid_pincode(self):
+    def test_invalid_pincode(self, geocoder):
         """Test handling of invalid pincode."""
-        result = self.geocoder.geocode(
+        result = geocoder.geocode(
             normalized_text="Some Address",
             pincode="000000"  # Invalid - starts with 0
         )
@@ -200,23 +172,30 @@ class TestContextualGeocoder:
         # Should not use pincode, fall back to other methods
         assert result["source"] != "pincode"
     
-    def test_coordinates_in_india(self):
+    @pytest.mark.parametrize("text,pincode", _INDIA_CASES)
+    def test_coordinates_in_india(self, geocoder, text, pincode):
         """Test that all results are within India bounds."""
-        test_cases = [
-            {"normalized_text": "Mumbai", "pincode": "400001"},
-            {"normalized_text": "Delhi", "pincode": "110001"},
-            {"normalized_text": "Chennai"},
-            {"normalized_text": "Random Place"},
-        ]
-        
-        for case in test_cases:
-            result = self.geocoder.geocode(**case)
-            lat = result["coordinates"]["lat"]
-            lon = result["coordinates"]["lon"]
-            
-            # India bounds: lat 6-36, lon 68-98
-            assert 6.0 <= lat <= 36.0, f"Lat {lat} out of India bounds"
-            assert 68.0 <= lon <= 98.0, f"Lon {lon} out of India bounds"
+        result = geocoder.geocode(text, pincode=pincode)
+        lat = result["coordinates"]["lat"]
+        lon = result["coordinates"]["lon"]
+        
+        # India bounds: lat 6-36, lon 68-98
+        assert 6.0 <= lat <= 36.0, f"Lat {lat} out of India bounds"
+        assert 68.0 <= lon <= 98.0, f"Lon {lon} out of India bounds"
+    
+    def test_geocode_batch_in_india(self, geocoder):
+        """Test that batch geocoding matches geocode() and stays in India."""
+        results = geocoder.geocode_batch(list(_INDIA_CASES))
+        
+        assert len(results) == len(_INDIA_CASES)
+        for (text, pincode), result in zip(_INDIA_CASES, results):
+            assert result == geocoder.geocode(text, pincode=pincode)
+        
+        # India bounds: lat 6-36, lon 68-98 (one vectorized check per axis)
+        coords = np.array([(r["coordinates"]["lat"], r["coordinates"]["lon"]) for r in results])
+        lats, lons = coords[:, 0], coords[:, 1]
+        assert ((6.0 <= lats) & (lats <= 36.0)).all(), f"Lats {lats} out of India bounds"
+        assert ((68.0 <= lons) & (lons <= 98.0)).all(), f"Lons {lons} out of India bounds"
 
 
 class TestConvenienceFunction:
@@ -10,241 +10,101 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from geospatial_nlp.landmark_extractor import ExtractedLandmark, LandmarkExtractor, extract_landmarks
 
-from geospatial_nlp.landmark_extractor import LandmarkExtractor, extract_landmarks
+
+@pytest.fixture(scope="class")
+def extractor():
+    """Shared extractor per test class; extract() does not mutate it."""
+    return LandmarkExtractor(use_ner=False, use_fuzzy=False)
 
 
 class TestLandmarkExtractor:
     """Test suite for LandmarkExtractor class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.extractor = LandmarkExtractor(use_ner=False, use_fuzzy=False)
-    
-    # -------------------------------------------------------------------------
-    # Religious Landmarks
-    # -------------------------------------------------------------------------
-    
-    def test_extract_temple(self):
-        """Test extraction of temple landmarks."""
-        result = self.extractor.extract("Near Shiv Temple, Main Road")
-        
-        assert len(result) >= 1
-        temple_found = any("temple" in lm["normalized"].lower() for lm in result)
-        assert temple_found
-    
-    def test_extract_mandir(self):
-        """Test extraction of mandir (Hindi temple) landmarks."""
-        result = self.extractor.extract("Opposite Ram Mandir Gate")
-        
-        assert len(result) >= 1
-        mandir_found = any("mandir" in lm["text"].lower() for lm in result)
-        assert mandir_found
-    
-    def test_extract_masjid(self):
-        """Test extraction of mosque landmarks."""
-        result = self.extractor.extract("Behind Jama Masjid")
-        
-        assert len(result) >= 1
-        masjid_found = any("masjid" in lm["text"].lower() for lm in result)
-        assert masjid_found
-    
-    def test_extract_gurudwara(self):
-        """Test extraction of gurudwara landmarks."""
-        result = self.extractor.extract("Near Gurudwara Sahib")
-        
-        assert len(result) >= 1
-        gurudwara_found = any("gurudwara" in lm["text"].lower() for lm in result)
-        assert gurudwara_found
-    
-    # -------------------------------------------------------------------------
-    # Transport Landmarks
-    # -------------------------------------------------------------------------
-    
-    def test_extract_railway_station(self):
-        """Test extraction of railway station landmarks."""
-        result = self.extractor.extract("Opposite Mumbai Central Railway Station")
-        
-        assert len(result) >= 1
-        station_found = any("railway station" in lm["text"].lower() for lm in result)
-        assert station_found
-    
-    def test_extract_bus_stand(self):
-        """Test extraction of bus stand landmarks."""
-        result = self.extractor.extract("Near ISBT Bus Stand")
-        
-        assert len(result) >= 1
-        bus_found = any("bus" in lm["text"].lower() for lm in result)
-        assert bus_found
-    
-    def test_extract_metro_station(self):
-        """Test extraction of metro station landmarks."""
-        result = self.extractor.extract("Near Rajiv Chowk Metro Station")
-        
-        assert len(result) >= 1
-        metro_found = any("metro" in lm["text"].lower() for lm in result)
-        assert metro_found
-    
-    # -------------------------------------------------------------------------
-    # Commercial Landmarks
-    # -------------------------------------------------------------------------
-    
-    def test_extract_market(self):
-        """Test extraction of market landmarks."""
-        result = self.extractor.extract("Near Crawford Market")
-        
-        assert len(result) >= 1
-        market_found = any("market" in lm["text"].lower() for lm in result)
-        assert market_found
-    
-    def test_extract_mall(self):
-        """Test extraction of mall landmarks."""
-        result = self.extractor.extract("Opposite Phoenix Mall")
-        
-        assert len(result) >= 1
-        mall_found = any("mall" in lm["text"].lower() for lm in result)
-        assert mall_found
-    
-    # -------------------------------------------------------------------------
-    # Education Landmarks
-    # -------------------------------------------------------------------------
-    
-    def test_extract_school(self):
-        """Test extraction of school landmarks."""
-        result = self.extractor.extract("Near St. Xavier's School")
-        
-        assert len(result) >= 1
-        school_found = any("school" in lm["text"].lower() for lm in result)
-        assert school_found
-    
-    def test_extract_college(self):
-        """Test extraction of college landmarks."""
-        result = self.extractor.extract("Behind Wilson College")
-        
-        assert len(result) >= 1
-        college_found = any("college" in lm["text"].lower() for lm in result)
-        assert college_found
-    
-    # -------------------------------------------------------------------------
-    # Health Landmarks
-    # -------------------------------------------------------------------------
-    
-    def test_extract_hospital(self):
-        """Test extraction of hospital landmarks."""
-        result = self.extractor.extract("Near Lilavati Hospital")
-        
-        assert len(result) >= 1
-        hospital_found = any("hospital" in lm["text"].lower() for lm in result)
-        assert hospital_found
-    
-    # -------------------------------------------------------------------------
-    # Government Landmarks
-    # -------------------------------------------------------------------------
-    
-    def test_extract_police_station(self):
-        """Test extraction of police station landmarks."""
-        result = self.extractor.extract("Behind Andheri Police Station")
-        
-        assert len(result) >= 1
-        police_found = any("police" in lm["text"].lower() for lm in result)
-        assert police_found
-    
-    def test_extract_post_office(self):
-        """Test extraction of post office landmarks."""
-        result = self.extractor.extract("Near GPO Post Office")
-        
-        assert len(result) >= 1
-        post_found = any("post" in lm["text"].lower() for lm in result)
-        assert post_found
-    
-    # -------------------------------------------------------------------------
-    # Infrastructure Landmarks
     # -------------------------------------------------------------------------
-    
-    def test_extract_bridge(self):
-        """Test extraction of bridge landmarks."""
-        result = self.extractor.extract("Near Mahalaxmi Bridge")
-        
-        assert len(result) >= 1
-        bridge_found = any("bridge" in lm["text"].lower() for lm in result)
-        assert bridge_found
-    
-    def test_extract_chowk(self):
-        """Test extraction of chowk/square landmarks."""
-        result = self.extractor.extract("Near Teen Murti Chowk")
-        
-        assert len(result) >= 1
-        chowk_found = any("chowk" in lm["text"].lower() for lm in result)
-        assert chowk_found
+    # Pattern Extraction Tests
+    # -------------------------------------------------------------------------
+    
+    @pytest.mark.parametrize("text,field,needle", [
+        # Religious
+        ("Near Shiv Temple, Main Road", "normalized", "temple"),
+        ("Opposite Ram Mandir Gate", "text", "mandir"),
+        ("Behind Jama Masjid", "text", "masjid"),
+        ("Near Gurudwara Sahib", "text", "gurudwara"),
+        # Transport
+        ("Opposite Mumbai Central Railway Station", "text", "railway station"),
+        ("Near ISBT Bus Stand", "text", "bus"),
+        ("Near Rajiv Chowk Metro Station", "text", "metro"),
+        # Commercial
+        ("Near Crawford Market", "text", "market"),
+        ("Opposite Phoenix Mall", "text", "mall"),
+        # Education
+        ("Near St. Xavier's School", "text", "school"),
+        ("Behind Wilson College", "text", "college"),
+        # Health
+        ("Near Lilavati Hospital", "text", "hospital"),
+        # Government
+        ("Behind Andheri Police Station", "text", "police"),
+        ("Near GPO Post Office", "text", "post"),
+        # Infrastructure
+        ("Near Mahalaxmi Bridge", "text", "bridge"),
+        ("Near Teen Murti Chowk", "text", "chowk"),
+    ])
+    def test_extract_landmark(self, extractor, text, field, needle):
+        """Test extraction of a landmark of each known type."""
+        result = extractor.extract(text)
+        
+        assert len(result) >= 1
+        assert any(needle in lm[field].lower() for lm in result)
     
     # -------------------------------------------------------------------------
     # Positional Context Tests
     # -------------------------------------------------------------------------
     
-    def test_position_near(self):
-        """Test detection of 'near' positional context."""
-        result = self.extractor.extract("Near Big Bazaar")
-        
-        assert len(result) >= 1
-        # At least one landmark should have position="near"
-        near_found = any(lm.get("position") == "near" for lm in result)
-        assert near_found
-    
-    def test_position_opposite(self):
-        """Test detection of 'opposite' positional context."""
-        result = self.extractor.extract("Opposite City Mall")
-        
-        assert len(result) >= 1
-        opp_found = any(lm.get("position") == "opposite" for lm in result)
-        assert opp_found
-    
-    def test_position_behind(self):
-        """Test detection of 'behind' positional context."""
-        result = self.extractor.extract("Behind Central Park")
+    @pytest.mark.parametrize("text,position", [
+        ("Near Big Bazaar", "near"),
+        ("Opposite City Mall", "opposite"),
+        ("Behind Central Park", "behind"),
+    ])
+    def test_position(self, extractor, text, position):
+        """Test detection of positional context."""
+        result = extractor.extract(text)
         
         assert len(result) >= 1
-        behind_found = any(lm.get("position") == "behind" for lm in result)
-        assert behind_found
+        # At least one landmark should carry the positional keyword
+        assert any(lm.get("position") == position for lm in result)
     
     # -------------------------------------------------------------------------
     # Category Classification Tests
     # -------------------------------------------------------------------------
     
-    def test_category_religious(self):
-        """Test religious landmark category assignment."""
-        result = self.extractor.extract("Near Shiv Temple")
+    @pytest.mark.parametrize("text,category", [
+        ("Near Shiv Temple", "religious"),
+        ("Near Railway Station", "transport"),
+    ])
+    def test_category(self, extractor, text, category):
+        """Test landmark category assignment."""
+        result = extractor.extract(text)
         
         assert len(result) >= 1
-        religious_found = any(lm["category"] == "religious" for lm in result)
-        assert religious_found
-    
-    def test_category_transport(self):
-        """Test transport landmark category assignment."""
-        result = self.extractor.extract("Near Railway Station")
-        
-        assert len(result) >= 1
-        transport_found = any(lm["category"] == "transport" for lm in result)
-        assert transport_found
+        assert any(lm["category"] == category for lm in result)
     
     # -------------------------------------------------------------------------
     # Confidence Scoring Tests
     # -------------------------------------------------------------------------
     
-    def test_confidence_in_range(self):
+    def test_confidence_in_range(self, extractor):
         """Test that confidence scores are in valid range."""
-        result = self.extractor.extract("Near Shiv Temple, Opposite Mall")
+        result = extractor.extract("Near Shiv Temple, Opposite Mall")
         
         for lm in result:
             assert 0.0 <= lm["confidence"] <= 1.0
     
-    def test_pattern_match_high_confidence(self):
+    def test_pattern_match_high_confidence(self, extractor):
         """Test that pattern matches have high confidence."""
-        result = self.extractor.extract("Near Railway Station")
+        result = extractor.extract("Near Railway Station")
         
         # Pattern matches should have confidence >= 0.8
         for lm in result:
@@ -255,30 +115,30 @@ class TestLandmarkExtractor:
     # Edge Cases
     # -------------------------------------------------------------------------
     
-    def test_empty_input(self):
+    def test_empty_input(self, extractor):
         """Test handling of empty input."""
-        result = self.extractor.extract("")
+        result = extractor.extract("")
         assert result == []
     
-    def test_no_landmarks(self):
+    def test_no_landmarks(self, extractor):
         """Test address with no landmarks."""
-        result = self.extractor.extract("123 Main Street")
+        result = extractor.extract("123 Main Street")
         # May have no results or only low-confidence ones
         high_conf = [lm for lm in result if lm["confidence"] >= 0.7]
         assert len(high_conf) == 0
     
-    def test_multiple_landmarks(self):
+    def test_multiple_landmarks(self, extractor):
         """Test extraction of multiple landmarks."""
-        result = self.extractor.extract(
+        result = extractor.extract(
             "Near Shiv Temple, Opposite Railway Station, Behind City Hospital"
         )
         
         # Should extract at least 2 landmarks
         assert len(result) >= 2
     
-    def test_deduplication(self):
+    def test_deduplication(self, extractor):
         """Test that duplicate landmarks are removed."""
-        result = self.extractor.extract(
+        result = extractor.extract(
             "Near Temple, Near the Temple, Beside Temple"
         )
         
@@ -288,6 +148,14 @@ class TestLandmarkExtractor:
         
         # May have some duplicates before dedup, but output should be clean
         assert len(result) <= 5  # Reasonable limit
+    
+    def test_extract_records_match_dicts(self, extractor):
+        """Test that record output carries the same data as extract()."""
+        text = "Near Shiv Temple, Opposite Railway Station"
+        records = extractor.extract_records(text)
+        
+        assert all(isinstance(lm, ExtractedLandmark) for lm in records)
+        assert [lm.to_dict() for lm in records] == extractor.extract(text)
 
 
 class TestConvenienceFunction:
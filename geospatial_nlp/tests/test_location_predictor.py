@@ -0,0 +1,164 @@
+"""
+Tests for Location Predictor module.
+
+Tests cover:
+- Anchor selection
+- Input handling
+- Offset kernels and batch prediction
+"""
+
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from geospatial_nlp._geo_njit import offset_coord_njit
+from geospatial_nlp.location_predictor import (
+    RELATIVE_DIRECTION_CONFIG,
+    LocationPredictor,
+    haversine_distance,
+    offset_coordinate,
+    offset_coordinates_vec,
+    random_bearing,
+)
+
+
+_ANCHOR = {"name": "Shiv Temple", "lat": 19.0760, "lng": 72.8777, "similarity": 0.9}
+
+# (matched_landmarks, address_components) covering every predict() branch
+_BATCH_CASES = (
+    ([_ANCHOR], {}),
+    ([_ANCHOR], {"directions": ["behind"]}),
+    ([_ANCHOR], {"directions": ["beside"], "street_info": {"street_numbers": [{"number": "3"}]}}),
+    ([], {}),
+    ([{"name": "Old Fort", "latitude": 28.61, "longitude": 77.23}], {"directions": ["near"]}),
+    ([{"name": "No Coords", "similarity": 0.8}], {}),
+)
+
+
+@pytest.fixture
+def predictor():
+    """Seeded predictor; each test gets a fresh random state."""
+    return LocationPredictor(seed=42)
+
+
+class TestLocationPredictor:
+    """Test suite for LocationPredictor class."""
+    
+    def test_alternate_keys_do_not_mutate_input(self, predictor):
+        """Test that latitude/longitude landmarks are normalized on a copy."""
+        landmark = {"name": "Shiv Temple", "latitude": 19.07, "longitude": 72.87}
+        original = copy.deepcopy(landmark)
+        
+        result = predictor.predict([landmark], {})
+        
+        assert landmark == original
+        assert result["anchor_landmark"]["lat"] == 19.07
+        assert result["anchor_landmark"]["lng"] == 72.87
+        assert "similarity" not in result["anchor_landmark"]
+        assert result["method"] == "landmark_direct"
+    
+    def test_alternate_keys_default_similarity(self, predictor):
+        """Test that landmarks without a similarity rank at 0.5."""
+        landmarks = [
+            {"name": "Low", "latitude": 19.0, "longitude": 72.0, "similarity": 0.4},
+            {"name": "Unscored", "latitude": 19.1, "longitude": 72.1},
+            {"name": "High", "latitude": 19.2, "longitude": 72.2, "similarity": 0.6},
+        ]
+        
+        assert predictor._select_anchor(landmarks)["name"] == "High"
+        assert predictor._select_anchor(landmarks[:2])["name"] == "Unscored"
+    
+    def test_default_offset_uses_random_bearing(self):
+        """Test that undirected offsets draw their bearing via random_bearing()."""
+        predictor = LocationPredictor(seed=7)
+        expected = random_bearing(random.Random(7))
+        
+        result = predictor.predict([_ANCHOR], {})
+        
+        assert 0 <= expected < 360
+        assert result["bearing_applied_deg"] == round(expected, 1)
+        assert result["offset_applied_m"] == predictor.default_offset_m
+    
+    def test_offset_coordinates_vec_matches_scalar(self):
+        """Test the vectorized offset against offset_coordinate()."""
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(8, 35, 50)
+        lons = rng.uniform(68, 97, 50)
+        bearings = rng.uniform(0, 360, 50)
+        distances = rng.uniform(0, 500, 50)
+        
+        new_lats, new_lons = offset_coordinates_vec(lats, lons, bearings, distances)
+        expected = [offset_coordinate(*args) for args in zip(lats, lons, bearings, distances)]
+        
+        assert new_lats.shape == new_lons.shape == (50,)
+        np.testing.assert_allclose(new_lats, [e[0] for e in expected], rtol=0, atol=1e-9)
+        np.testing.assert_allclose(new_lons, [e[1] for e in expected], rtol=0, atol=1e-9)
+    
+    def test_offset_coord_njit_matches_scalar(self):
+        """Test the numba offset kernel against offset_coordinate()."""
+        rng = np.random.default_rng(1)
+        cases = zip(rng.uniform(8, 35, 200), rng.uniform(68, 97, 200), rng.uniform(0, 360, 200), rng.uniform(0, 5000, 200))
+        
+        for lat, lon, bearing, distance in cases:
+            np.testing.assert_allclose(
+                offset_coord_njit(lat, lon, bearing, distance),
+                offset_coordinate(lat, lon, bearing, distance),
+                rtol=0,
+                atol=1e-9,
+            )
+        assert offset_coord_njit(19.07, 72.87, 45.0, 0.0) == pytest.approx((19.07, 72.87))
+    
+    def test_predict_batch_bounds(self, predictor):
+        """Test batch output order, fallbacks and offset ranges."""
+        results = predictor.predict_batch(*zip(*_BATCH_CASES))
+        
+        assert len(results) == len(_BATCH_CASES)
+        assert [r["method"] for r in results] == [
+            "landmark_direct", "landmark_offset", "landmark_offset",
+            "fallback", "landmark_offset", "fallback",
+        ]
+        
+        for (landmarks, components), result in zip(_BATCH_CASES, results):
+            if result["method"] == "fallback":
+                continue
+            direction = result["direction_used"]
+            if direction:
+                config = RELATIVE_DIRECTION_CONFIG[direction]
+                lane = 45 if components.get("street_info") else 0
+                assert config["min_offset_m"] + lane <= result["offset_applied_m"] <= config["max_offset_m"] + lane
+            else:
+                assert result["offset_applied_m"] == predictor.default_offset_m
+            assert 0 <= result["bearing_applied_deg"] < 360
+            
+            # The applied offset moves the point by the reported distance
+            anchor = result["anchor_landmark"]
+            moved = haversine_distance(anchor["lat"], anchor["lng"], result["lat"], result["lng"])
+            assert moved == pytest.approx(result["offset_applied_m"], abs=0.5)
+    
+    @pytest.mark.parametrize("n_landmarks,n_components", [(2, 3), (3, 2), (0, 1)])
+    def test_predict_batch_length_mismatch(self, predictor, n_landmarks, n_components):
+        """Test that mismatched input lists raise instead of dropping rows."""
+        with pytest.raises(ValueError, match="entries"):
+            predictor.predict_batch([[_ANCHOR]] * n_landmarks, [{}] * n_components)
+    
+    def test_predict_batch_empty(self, predictor):
+        """Test an empty batch."""
+        assert predictor.predict_batch([], []) == []
+    
+    def test_predict_batch_matches_predict_with_fixed_offset(self, predictor):
+        """Test that batch and single predictions agree once offsets are fixed."""
+        predictor._calculate_offset = lambda direction, street_info: (
+            123.0, 60.0 + predictor._lane_offset(street_info)
+        )
+        predictor._draw_offset_params = lambda direction, n: (np.full(n, 123.0), np.full(n, 60.0))
+        
+        batch = predictor.predict_batch(*zip(*_BATCH_CASES))
+        single = [predictor.predict(landmarks, components) for landmarks, components in _BATCH_CASES]
+        
+        assert batch == single
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -10,185 +10,111 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from geospatial_nlp.normalizer import AddressNormalizer, normalize_address
 
 
+@pytest.fixture(scope="class")
+def normalizer():
+    """Shared normalizer per test class; normalize() does not mutate it."""
+    return AddressNormalizer()
+
+
 class TestAddressNormalizer:
     """Test suite for AddressNormalizer class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.normalizer = AddressNormalizer()
-    
-    # -------------------------------------------------------------------------
-    # Abbreviation Tests
-    # -------------------------------------------------------------------------
-    
-    def test_expand_road_abbreviation(self):
-        """Test that 'Rd' is expanded to 'road'."""
-        result = self.normalizer.normalize("MG Rd, Bangalore")
-        assert "road" in result["text"].lower()
-    
-    def test_expand_near_abbreviation(self):
-        """Test that 'Nr' is expanded to 'near'."""
-        result = self.normalizer.normalize("Nr Railway Stn")
-        assert "near" in result["text"].lower()
-    
-    def test_expand_opposite_abbreviation(self):
-        """Test that 'Opp' is expanded to 'opposite'."""
-        result = self.normalizer.normalize("Opp to SBI Bank")
-        assert "opposite" in result["text"].lower()
-    
-    def test_expand_station_abbreviation(self):
-        """Test that 'Stn' is expanded to 'station'."""
-        result = self.normalizer.normalize("Andheri Stn")
-        assert "station" in result["text"].lower()
-    
-    def test_expand_building_abbreviation(self):
-        """Test that 'Bldg' is expanded to 'building'."""
-        result = self.normalizer.normalize("ABC Bldg, Floor 2")
-        assert "building" in result["text"].lower()
-    
-    # -------------------------------------------------------------------------
-    # Transliteration Tests
-    # -------------------------------------------------------------------------
-    
-    def test_transliterate_gali(self):
-        """Test that 'gali' is translated to 'lane'."""
-        result = self.normalizer.normalize("Ram Gali")
-        assert "lane" in result["text"].lower()
-    
-    def test_transliterate_chowk(self):
-        """Test that 'chowk' is translated to 'square'."""
-        result = self.normalizer.normalize("Teen Murti Chowk")
-        assert "square" in result["text"].lower()
-    
-    def test_transliterate_mandir(self):
-        """Test that 'mandir' is translated to 'temple'."""
-        result = self.normalizer.normalize("Shiv Mandir Road")
-        assert "temple" in result["text"].lower()
-    
-    def test_transliterate_mohalla(self):
-        """Test that 'mohalla' is translated to 'locality'."""
-        result = self.normalizer.normalize("Rajput Mohalla")
-        assert "locality" in result["text"].lower()
-    
     # -------------------------------------------------------------------------
-    # City Name Normalization Tests
+    # Abbreviation, Transliteration and City Name Tests
     # -------------------------------------------------------------------------
     
-    def test_normalize_bombay_to_mumbai(self):
-        """Test that 'Bombay' is normalized to 'mumbai'."""
-        result = self.normalizer.normalize("Bombay Central")
-        assert "mumbai" in result["text"].lower()
-    
-    def test_normalize_madras_to_chennai(self):
-        """Test that 'Madras' is normalized to 'chennai'."""
-        result = self.normalizer.normalize("Madras High Court")
-        assert "chennai" in result["text"].lower()
-    
-    def test_normalize_calcutta_to_kolkata(self):
-        """Test that 'Calcutta' is normalized to 'kolkata'."""
-        result = self.normalizer.normalize("Calcutta Port")
-        assert "kolkata" in result["text"].lower()
-    
-    def test_normalize_bangalore_to_bengaluru(self):
-        """Test that 'Bangalore' is normalized to 'bengaluru'."""
-        result = self.normalizer.normalize("Bangalore East")
-        assert "bengaluru" in result["text"].lower()
+    @pytest.mark.parametrize("text,expected", [
+        # Abbreviations
+        ("MG Rd, Bangalore", "road"),
+        ("Nr Railway Stn", "near"),
+        ("Opp to SBI Bank", "opposite"),
+        ("Andheri Stn", "station"),
+        ("ABC Bldg, Floor 2", "building"),
+        # Hindi transliterations
+        ("Ram Gali", "lane"),
+        ("Teen Murti Chowk", "square"),
+        ("Shiv Mandir Road", "temple"),
+        ("Rajput Mohalla", "locality"),
+        # Old city names
+        ("Bombay Central", "mumbai"),
+        ("Madras High Court", "chennai"),
+        ("Calcutta Port", "kolkata"),
+        ("Bangalore East", "bengaluru"),
+        # Directional suffixes
+        ("Andheri (E)", "east"),
+        ("Santa Cruz (W)", "west"),
+    ])
+    def test_expands_to_canonical(self, normalizer, text, expected):
+        """Test that abbreviations and variants expand to their canonical word."""
+        result = normalizer.normalize(text)
+        assert expected in result["text"].lower()
     
     # -------------------------------------------------------------------------
     # Pincode Extraction Tests
     # -------------------------------------------------------------------------
     
-    def test_extract_pincode_plain(self):
-        """Test extraction of plain 6-digit pincode."""
-        result = self.normalizer.normalize("Mumbai 400001")
-        assert result["pincode"] == "400001"
-    
-    def test_extract_pincode_with_hyphen(self):
-        """Test extraction of hyphenated pincode."""
-        result = self.normalizer.normalize("Mumbai-400069")
-        assert result["pincode"] == "400069"
-    
-    def test_extract_pincode_with_prefix(self):
-        """Test extraction of pincode with 'PIN:' prefix."""
-        result = self.normalizer.normalize("Andheri East, PIN: 400069")
-        assert result["pincode"] == "400069"
-    
-    def test_no_pincode(self):
+    @pytest.mark.parametrize("text,pincode", [
+        ("Mumbai 400001", "400001"),
+        ("Mumbai-400069", "400069"),
+        ("Andheri East, PIN: 400069", "400069"),
+    ], ids=["plain", "hyphen", "prefix"])
+    def test_extract_pincode(self, normalizer, text, pincode):
+        """Test extraction of plain, hyphenated and 'PIN:'-prefixed pincodes."""
+        result = normalizer.normalize(text)
+        assert result["pincode"] == pincode
+    
+    def test_no_pincode(self, normalizer):
         """Test that None is returned when no pincode present."""
-        result = self.normalizer.normalize("Andheri East, Mumbai")
+        result = normalizer.normalize("Andheri East, Mumbai")
         assert result["pincode"] is None
     
-    def test_invalid_pincode_not_extracted(self):
+    def test_invalid_pincode_not_extracted(self, normalizer):
         """Test that invalid pincodes (starting with 0) are not extracted."""
-        result = self.normalizer.normalize("Phone: 022456789")
+        result = normalizer.normalize("Phone: 022456789")
         assert result["pincode"] is None
     
-    # -------------------------------------------------------------------------
-    # Directional Suffix Tests
-    # -------------------------------------------------------------------------
-    
-    def test_expand_east_suffix(self):
-        """Test that (E) is expanded to 'East'."""
-        result = self.normalizer.normalize("Andheri (E)")
-        assert "east" in result["text"].lower()
-    
-    def test_expand_west_suffix(self):
-        """Test that (W) is expanded to 'West'."""
-        result = self.normalizer.normalize("Santa Cruz (W)")
-        assert "west" in result["text"].lower()
-    
     # -------------------------------------------------------------------------
     # State/City Identification Tests
     # -------------------------------------------------------------------------
     
-    def test_identify_state_maharashtra(self):
-        """Test state identification for Maharashtra."""
-        result = self.normalizer.normalize("Mumbai, Maharashtra")
-        assert result["state"] == "MH"
-    
-    def test_identify_city_mumbai(self):
-        """Test city identification for Mumbai."""
-        result = self.normalizer.normalize("Andheri East, Mumbai")
-        assert result["city"] == "Mumbai"
-    
-    def test_identify_city_delhi(self):
-        """Test city identification for Delhi."""
-        result = self.normalizer.normalize("Connaught Place, Delhi")
-        assert result["city"] == "Delhi"
+    @pytest.mark.parametrize("text,key,expected", [
+        ("Mumbai, Maharashtra", "state", "MH"),
+        ("Andheri East, Mumbai", "city", "Mumbai"),
+        ("Connaught Place, Delhi", "city", "Delhi"),
+    ])
+    def test_identify_place(self, normalizer, text, key, expected):
+        """Test state and city identification."""
+        result = normalizer.normalize(text)
+        assert result[key] == expected
     
     # -------------------------------------------------------------------------
     # Edge Cases
     # -------------------------------------------------------------------------
     
-    def test_empty_input(self):
+    def test_empty_input(self, normalizer):
         """Test handling of empty input."""
-        result = self.normalizer.normalize("")
+        result = normalizer.normalize("")
         assert result["text"] == ""
         assert result["pincode"] is None
     
-    def test_none_input(self):
+    def test_none_input(self, normalizer):
         """Test handling of None input."""
-        result = self.normalizer.normalize(None)
+        result = normalizer.normalize(None)
         assert result["text"] == ""
     
-    def test_whitespace_normalization(self):
+    def test_whitespace_normalization(self, normalizer):
         """Test that multiple spaces are collapsed."""
-        result = self.normalizer.normalize("Mumbai   Central    Station")
+        result = normalizer.normalize("Mumbai   Central    Station")
         assert "  " not in result["text"]
     
-    def test_preserves_original(self):
+    def test_preserves_original(self, normalizer):
         """Test that original text is preserved in output."""
         original = "Opp Railway Stn, Mumbai-400001"
-        result = self.normalizer.normalize(original)
+        result = normalizer.normalize(original)
         assert result["original"] == original
 
 
@@ -241,27 +167,25 @@ MESSY_ADDRESS_SAMPLES = [
 class TestIntegration:
     """Integration tests with realistic messy addresses."""
     
-    def test_messy_addresses(self):
+    @pytest.mark.parametrize("sample", MESSY_ADDRESS_SAMPLES)
+    def test_messy_addresses(self, normalizer, sample):
         """Test normalization of messy Indian addresses."""
-        normalizer = AddressNormalizer()
+        result = normalizer.normalize(sample["input"])
+        
+        # Check pincode
+        assert result["pincode"] == sample["expected_pincode"], \
+            f"Pincode mismatch for: {sample['input']}"
+        
+        # Check city
+        if sample["expected_city"]:
+            assert result["city"] == sample["expected_city"], \
+                f"City mismatch for: {sample['input']}"
         
-        for sample in MESSY_ADDRESS_SAMPLES:
-            result = normalizer.normalize(sample["input"])
-            
-            # Check pincode
-            assert result["pincode"] == sample["expected_pincode"], \
-                f"Pincode mismatch for: {sample['input']}"
-            
-            # Check city
-            if sample["expected_city"]:
-                assert result["city"] == sample["expected_city"], \
-                    f"City mismatch for: {sample['input']}"
-            
-            # Check expected terms are present
-            text_lower = result["text"].lower()
-            for term in sample["contains"]:
-                assert term in text_lower, \
-                    f"Expected '{term}' in normalized text for: {sample['input']}"
+        # Check expected terms are present
+        text_lower = result["text"].lower()
+        for term in sample["contains"]:
+            assert term in text_lower, \
+                f"Expected '{term}' in normalized text for: {sample['input']}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,473 @@
+"""
+Tests for shared utilities.
+
+Tests cover:
+- Text cleaning helpers against their original regex/NFKC behaviour
+- Vectorized distance helpers against the scalar haversine_distance()
+- Numba kernels (run as plain Python when numba is missing)
+- Pincode region lookup
+- Packed pincode centroid table and its shipped .npy arrays
+- India bounds mask against the scalar is_within_india()
+- State name resolution against a linear scan of the state data
+- State search in free text
+- Concurrent data warmup
+- Pickle cache for the JSON data files
+"""
+
+import copy
+import json
+import os
+import pickle
+import random
+import re
+import unicodedata
+
+import numpy as np
+import pytest
+
+from geospatial_nlp import utils
+from geospatial_nlp._geo_njit import filter_nearby_nb, haversine_batch_nb, haversine_nb
+from geospatial_nlp.utils import (
+    PincodeCentroids,
+    build_pincode_arrays,
+    clean_text,
+    filter_nearby,
+    find_state_in_text,
+    get_pincode_region,
+    haversine_distance,
+    haversine_distance_batch,
+    haversine_distance_fast,
+    is_within_india,
+    is_within_india_mask,
+    make_haversine_from,
+    normalize_whitespace,
+    remove_special_chars,
+    resolve_state_name,
+    warmup,
+)
+
+
+def _regex_remove_special_chars(text, keep_chars=".,/-#"):
+    """Reference: the original regex implementation of remove_special_chars()."""
+    return re.sub(rf'[^\w\s{re.escape(keep_chars)}]', '', text)
+
+
+# Every ASCII character plus a spread of non-ASCII letters, digits,
+# punctuation and whitespace
+_ASCII = "".join(chr(c) for c in range(128))
+_NON_ASCII = "éüñ²½ीनगर।—‘’“”…\u00a0\u2003\u200b™€₹①Ⅻ𝟙"
+
+
+def _reference_clean_text(text):
+    """Reference: the original NFKC + lower + regex whitespace clean_text()."""
+    if not text:
+        return ""
+    return re.sub(r'\s+', ' ', unicodedata.normalize("NFKC", text).lower()).strip()
+
+
+class TestCleanText:
+    """Test suite for the memoized clean_text() and normalize_whitespace()."""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("ｍｕｍｂａｉ　４０００１", "mumbai 40001"),  # fullwidth letters and space
+        ("Ｆlat ①, ﬁrst ﬂoor", "flat 1, first floor"),  # circled digit, ligatures
+        ("Café\u00a0Road\u2003East", "café road east"),  # composed char, NBSP, em space
+        ("नगर\n\tरोड", "नगर रोड"),
+        ("  Plain   ASCII\r\n ", "plain ascii"),
+        ("", ""),
+    ])
+    def test_examples(self, text, expected):
+        """Test the NFKC path for non-ASCII input and the ASCII fast path."""
+        assert clean_text(text) == expected
+    
+    def test_matches_reference(self):
+        """Test random ASCII and non-ASCII text against the original implementation."""
+        rng = random.Random(3)
+        alphabet = _ASCII + _NON_ASCII + "ｍ①ﬁ\u1e9b\u0323"
+        
+        for _ in range(1000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25)))
+            assert clean_text(text) == _reference_clean_text(text), repr(text)
+            assert normalize_whitespace(text) == re.sub(r'\s+', ' ', text).strip(), repr(text)
+    
+    @pytest.mark.parametrize("func", [clean_text, normalize_whitespace])
+    def test_results_are_cached(self, func):
+        """Test that a repeated input is a cache hit with the same result."""
+        func.cache_clear()
+        first = func("  Near  SHIV Temple ")
+        info = func.cache_info()
+        
+        assert func("  Near  SHIV Temple ") is first
+        assert func.cache_info().hits == info.hits + 1
+        assert func.cache_info().currsize == info.currsize
+
+
+class TestRemoveSpecialChars:
+    """Test suite for remove_special_chars()."""
+    
+    @pytest.mark.parametrize("keep_chars", [".,/-#", "", "#", "-]^\\", "ab"])
+    def test_matches_regex(self, keep_chars):
+        """Test ASCII (translate path) and non-ASCII (regex path) text."""
+        rng = random.Random(keep_chars)
+        texts = [_ASCII, _ASCII + _NON_ASCII, "Flat #12, B/4 - M.G. Road (East) @ Pune!"]
+        texts += ["".join(rng.choice(_ASCII + _NON_ASCII) for _ in range(30)) for _ in range(300)]
+        texts += ["".join(rng.choice(_ASCII) for _ in range(30)) for _ in range(300)]
+        
+        for text in texts:
+            assert remove_special_chars(text, keep_chars) == _regex_remove_special_chars(text, keep_chars), repr(text)
+    
+    def test_default_keep_chars(self):
+        """Test that address punctuation survives and the rest is removed."""
+        assert remove_special_chars("Flat #12, B/4 - M.G. Road (East) @ Pune!") == "Flat #12, B/4 - M.G. Road East  Pune"
+
+
+# Origins and destinations spread over (and a little beyond) India
+_RNG = np.random.default_rng(7)
+_LATS = _RNG.uniform(0, 40, 200)
+_LONS = _RNG.uniform(60, 100, 200)
+_ORIGINS = ((19.0760, 72.8777), (28.6139, 77.2090), (8.5, 97.9))
+
+
+def _scalar_distances(lat0, lon0, lats, lons):
+    """Reference distances from the scalar haversine_distance()."""
+    return np.array([haversine_distance(lat0, lon0, lat, lon) for lat, lon in zip(lats, lons)])
+
+
+def test_is_within_india_mask():
+    """Test the bounds mask against is_within_india(), edges included."""
+    edges = [(6.0, 68.0), (36.0, 98.0), (5.999, 80.0), (36.001, 80.0), (20.0, 67.999), (20.0, 98.001)]
+    lats = np.concatenate([_LATS, [lat for lat, _ in edges]])
+    lons = np.concatenate([_LONS, [lon for _, lon in edges]])
+    
+    mask = is_within_india_mask(lats, lons)
+    
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [is_within_india(lat, lon) for lat, lon in zip(lats, lons)]
+    assert mask.any() and not mask.all()
+
+
+@pytest.fixture
+def no_numba(monkeypatch):
+    """Disable numba dispatch so the helpers run their NumPy paths."""
+    monkeypatch.setattr(utils, "NUMBA_AVAILABLE", False)
+
+
+@pytest.mark.parametrize("origin", _ORIGINS)
+class TestDistanceHelpers:
+    """Test suite for the batch and specialised distance functions."""
+    
+    def test_haversine_distance_batch(self, origin):
+        """Test the NumPy batch against the scalar haversine."""
+        result = haversine_distance_batch(*origin, _LATS, _LONS)
+        
+        assert result.shape == _LATS.shape
+        np.testing.assert_allclose(result, _scalar_distances(*origin, _LATS, _LONS), rtol=1e-12, atol=1e-9)
+    
+    def test_haversine_distance_batch_lists(self, origin):
+        """Test that plain lists and an empty batch are accepted."""
+        lats, lons = list(_LATS[:5]), list(_LONS[:5])
+        
+        np.testing.assert_allclose(
+            haversine_distance_batch(*origin, lats, lons),
+            _scalar_distances(*origin, lats, lons),
+            rtol=1e-12,
+        )
+        assert haversine_distance_batch(*origin, [], []).shape == (0,)
+    
+    def test_make_haversine_from(self, origin):
+        """Test the fixed-origin closure against the scalar haversine."""
+        distance = make_haversine_from(*origin)
+        
+        result = [distance(lat, lon) for lat, lon in zip(_LATS, _LONS)]
+        
+        np.testing.assert_allclose(result, _scalar_distances(*origin, _LATS, _LONS), rtol=1e-12, atol=1e-9)
+        assert distance(*origin) == 0.0
+    
+    def test_haversine_distance_fast(self, origin):
+        """Test the law-of-cosines shortcut stays within a meter of haversine."""
+        # Far points plus near ones around the 1 km fallback threshold
+        offsets = np.linspace(-0.02, 0.02, 41)
+        lats = np.concatenate([_LATS, origin[0] + offsets, [origin[0]]])
+        lons = np.concatenate([_LONS, origin[1] + offsets[::-1], [origin[1]]])
+        
+        result = [haversine_distance_fast(*origin, lat, lon) for lat, lon in zip(lats, lons)]
+        
+        np.testing.assert_allclose(result, _scalar_distances(*origin, lats, lons), rtol=0, atol=1e-3)
+        assert result[-1] == 0.0
+    
+    @pytest.mark.parametrize("r_km", [0.0, 500.0, 1500.0, 1e5])
+    def test_filter_nearby(self, origin, r_km, no_numba):
+        """Test the radius-plus-bounds filter and its kernel against scalar checks."""
+        expected = [
+            is_within_india(lat, lon) and haversine_distance(*origin, lat, lon) <= r_km
+            for lat, lon in zip(_LATS, _LONS)
+        ]
+        
+        assert filter_nearby(*origin, _LATS, _LONS, r_km).tolist() == expected
+        assert filter_nearby(*origin, list(_LATS), list(_LONS), r_km).tolist() == expected
+        assert filter_nearby_nb(*origin, _LATS, _LONS, r_km).tolist() == expected
+    
+    def test_haversine_kernels(self, origin):
+        """Test the numba kernels against the scalar haversine."""
+        expected = _scalar_distances(*origin, _LATS, _LONS)
+        
+        scalar = [haversine_nb(*origin, lat, lon) for lat, lon in zip(_LATS, _LONS)]
+        np.testing.assert_allclose(scalar, expected, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(haversine_batch_nb(*origin, _LATS, _LONS), expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("digit,region", [
+    ("1", "Northern"),
+    ("2", "Uttar Pradesh"),
+    ("3", "Western"),
+    ("4", "Western-Central"),
+    ("5", "Southern"),
+    ("6", "Southern"),
+    ("7", "Eastern"),
+    ("8", "Eastern"),
+    ("9", "APO/FPO"),
+])
+def test_get_pincode_region(digit, region):
+    """Test the region for every valid lead digit, with separators too."""
+    assert get_pincode_region(f"{digit}10001") == region
+    assert get_pincode_region(f"{digit}10 001") == region
+
+
+@pytest.mark.parametrize("pincode", ["010001", "40001", "4000011", "4000a1", "", None])
+def test_get_pincode_region_invalid(pincode):
+    """Test that invalid pincodes have no region."""
+    assert get_pincode_region(pincode) is None
+
+
+class TestPincodeCentroids:
+    """Test suite for the array-backed pincode centroid table."""
+    
+    def test_packed_pincode_centroids(self):
+        """Test the array-backed centroid table behaves like the JSON dict."""
+        table = PincodeCentroids(
+            np.array([560001, 400001], dtype=np.uint32),
+            np.array([[12.9767, 77.5713], [18.9398, 72.8354]]),
+        )
+        
+        assert table["400001"] == (18.9398, 72.8354)
+        assert table.get("999999") is None
+        assert table.get(None) is None
+        assert list(table) == ["560001", "400001"]  # source order kept
+        
+        found = table.lookup_many(["400001", "999999", "abc"])
+        assert tuple(found[0]) == (18.9398, 72.8354)
+        assert np.isnan(found[1:]).all()
+        
+        packed = PincodeCentroids.from_mapping({"560001": [12.9767, 77.5713], "400001": [18.9398, 72.8354]})
+        assert list(packed.items()) == list(table.items())
+    
+    def test_pickle_round_trip(self):
+        """Test that the loaded (memory-mapped) table pickles and copies."""
+        table = utils.load_pincode_centroids()
+        
+        for clone in (pickle.loads(pickle.dumps(table)), copy.deepcopy(table)):
+            assert type(clone) is PincodeCentroids
+            assert list(clone.items()) == list(table.items())
+            assert clone["400001"] == table["400001"]
+    
+    def test_shipped_arrays_match_json(self, tmp_path):
+        """Test the committed .npy arrays are up to date with the JSON."""
+        pins_path, coords_path = tmp_path / "pins.npy", tmp_path / "coords.npy"
+        count = build_pincode_arrays(pins_path=pins_path, coords_path=coords_path)
+        
+        np.testing.assert_array_equal(np.load(utils.PINCODE_PINS_FILE), np.load(pins_path))
+        np.testing.assert_array_equal(np.load(utils.PINCODE_COORDS_FILE), np.load(coords_path))
+        
+        # The .npy load path serves the same table as the JSON
+        shipped = PincodeCentroids.from_npy(utils.PINCODE_PINS_FILE, utils.PINCODE_COORDS_FILE)
+        from_json = PincodeCentroids.from_mapping(utils._read_json(utils.DATA_DIR / "pincode_centroids.json"))
+        assert len(shipped) == count
+        assert list(shipped.items()) == list(from_json.items())
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch, tmp_path):
+    """Force the pickle cache path and point it at a temp directory."""
+    monkeypatch.setattr(utils, "ORJSON_AVAILABLE", False)
+    monkeypatch.setenv("GEOSPATIAL_NLP_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path
+
+
+def _scan_state_name(text):
+    """Reference resolver: linear scan of the raw state JSON."""
+    text_lower = text.lower().strip()
+    for code, info in utils._read_json(utils.DATA_DIR / "indian_states.json").items():
+        if text_lower == info["name"].lower():
+            return code
+        if text_lower in [a.lower() for a in info.get("aliases", [])]:
+            return code
+    return None
+
+
+def _state_spellings():
+    """Every state name and alias in the raw data, plus a few misses."""
+    spellings = ["", "atlantis", "maharashtra state", "m h"]
+    for info in utils._read_json(utils.DATA_DIR / "indian_states.json").values():
+        spellings.append(info["name"])
+        spellings.extend(info.get("aliases", []))
+    return spellings
+
+
+class TestResolveStateName:
+    """Test suite for the alias-index state resolver."""
+    
+    @pytest.mark.parametrize("text", _state_spellings())
+    def test_matches_linear_scan(self, text):
+        """Test that the index agrees with a first-match linear scan."""
+        assert resolve_state_name(text) == _scan_state_name(text)
+    
+    @pytest.mark.parametrize("text", _state_spellings())
+    def test_case_and_whitespace_variants(self, text):
+        """Test that as-written, upper, title and padded forms resolve alike."""
+        expected = _scan_state_name(text)
+        
+        for variant in (text.upper(), text.lower(), text.title(), f"  {text} ", f"{text.upper()}\n"):
+            assert resolve_state_name(variant) == expected, variant
+    
+    def test_aliases_are_lowercase_frozensets(self):
+        """Test loaded and fallback aliases match the raw data, lowercased."""
+        raw = utils._read_json(utils.DATA_DIR / "indian_states.json")
+        states = utils.load_indian_states()
+        
+        assert states.keys() == raw.keys()
+        for code, info in states.items():
+            assert isinstance(info["aliases"], frozenset)
+            assert info["aliases"] == {a.lower() for a in raw[code].get("aliases", [])}
+        for info in utils._get_fallback_states().values():
+            assert isinstance(info["aliases"], frozenset)
+            assert all(alias == alias.lower() for alias in info["aliases"])
+
+
+def _scan_state_in_text(text):
+    """Reference search: names anywhere, aliases between spaces or text edges."""
+    text_lower = text.lower()
+    for code, info in utils._read_json(utils.DATA_DIR / "indian_states.json").items():
+        if info["name"].lower() in text_lower:
+            return code
+        for alias in info.get("aliases", []):
+            if re.search(rf"(?<![^ ]){re.escape(alias.lower())}(?![^ ])", text_lower):
+                return code
+    return None
+
+
+class TestFindStateInText:
+    """Test suite for find_state_in_text()."""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("Flat 4, Andheri, Mumbai, Maharashtra 400053", "MH"),
+        ("Sector 18 Noida UP", "UP"),
+        ("Koregaon Park, Pune", None),
+        ("", None),
+    ])
+    def test_examples(self, text, expected):
+        """Test names anywhere and aliases only as whole words."""
+        assert find_state_in_text(text) == expected
+    
+    def test_matches_reference_scan(self):
+        """Test random address-like text against a regex reference scan."""
+        rng = random.Random(0)
+        words = [w for s in _state_spellings() for w in s.split()]
+        words += ["flat", "12", "road", "pune", "near", "mall,", "400001"]
+        
+        for _ in range(2000):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+            if rng.random() < 0.3:
+                text = text.upper()
+            assert find_state_in_text(text) == _scan_state_in_text(text), text
+
+
+_LOADERS = ("load_indian_states", "load_landmark_patterns", "load_pincode_centroids")
+
+
+class TestWarmup:
+    """Test suite for warmup()."""
+    
+    def test_populates_loader_caches(self):
+        """Test that warmup fills every loader cache with the serial result."""
+        expected = {}
+        for name in _LOADERS:
+            loader = getattr(utils, name)
+            loader.cache_clear()
+            expected[name] = loader.__wrapped__()
+        
+        warmup()
+        
+        for name in _LOADERS:
+            loader = getattr(utils, name)
+            assert loader.cache_info().currsize == 1
+            assert dict(loader()) == dict(expected[name])
+        
+        # Repeat warmups are cache hits
+        hits = utils.load_indian_states.cache_info().hits
+        warmup()
+        assert utils.load_indian_states.cache_info().hits == hits + 1
+    
+    def test_loader_errors_propagate(self, monkeypatch):
+        """Test that a failing loader raises from warmup()."""
+        def broken():
+            raise RuntimeError("corrupt data file")
+        monkeypatch.setattr(utils, "load_landmark_patterns", broken)
+        
+        with pytest.raises(RuntimeError, match="corrupt data file"):
+            warmup()
+
+
+class TestLoadCached:
+    """Test suite for the JSON pickle cache."""
+    
+    def test_cache_written_outside_data_dir(self, stdlib_json):
+        """Test that the pickle lands in the cache dir, not next to the JSON."""
+        json_path = stdlib_json / "states.json"
+        json_path.write_text(json.dumps({"MH": {"name": "Maharashtra"}}))
+        
+        assert utils._load_cached(json_path) == {"MH": {"name": "Maharashtra"}}
+        
+        cached = list((stdlib_json / "cache").iterdir())
+        assert len(cached) == 1
+        assert cached[0].suffix == ".pkl"
+        assert not list(stdlib_json.glob("*.pkl"))
+    
+    def test_cache_hit_and_refresh(self, stdlib_json, monkeypatch):
+        """Test that the pickle is reused until the JSON is newer."""
+        json_path = stdlib_json / "states.json"
+        json_path.write_text(json.dumps({"v": 1}))
+        read_json = utils._read_json
+        utils._load_cached(json_path)
+        
+        # A cache hit never re-parses the JSON
+        def fail(path):
+            raise AssertionError("JSON parsed on a cache hit")
+        monkeypatch.setattr(utils, "_read_json", fail)
+        assert utils._load_cached(json_path) == {"v": 1}
+        monkeypatch.setattr(utils, "_read_json", read_json)
+        
+        json_path.write_text(json.dumps({"v": 2}))
+        pkl_path = next((stdlib_json / "cache").iterdir())
+        mtime = json_path.stat().st_mtime
+        os.utime(pkl_path, (mtime - 10, mtime - 10))
+        
+        assert utils._load_cached(json_path) == {"v": 2}
+        assert len(list((stdlib_json / "cache").iterdir())) == 1
+    
+    def test_unwritable_cache_dir(self, stdlib_json, monkeypatch):
+        """Test that a failed cache write still returns the data."""
+        (stdlib_json / "blocker").write_text("")
+        monkeypatch.setenv("GEOSPATIAL_NLP_CACHE_DIR", str(stdlib_json / "blocker" / "cache"))
+        json_path = stdlib_json / "states.json"
+        json_path.write_text(json.dumps([1, 2, 3]))
+        
+        assert utils._load_cached(json_path) == [1, 2, 3]
+    
+    def test_missing_json_raises(self, stdlib_json):
+        """Test that loaders still see FileNotFoundError for missing data."""
+        with pytest.raises(FileNotFoundError):
+            utils._load_cached(stdlib_json / "missing.json")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -8,42 +8,81 @@ Contains helper functions used across all modules:
 - State/district lookups
 """
 
+import os
 import re
 import math
 import json
+import pickle
+import hashlib
+import sys
+import tempfile
 import unicodedata
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
+from types import MappingProxyType
+from collections.abc import ItemsView
+from typing import Iterable, Iterator, Mapping, Optional, Sequence, Tuple, List, Dict
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+import numpy as np
+
+# Conditional import - orjson parses JSON several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ._geo_njit import NUMBA_AVAILABLE, filter_nearby_nb, haversine_batch_nb
+
 # Get the data directory path relative to this file
 DATA_DIR = Path(__file__).parent / "data"
 
+# Packed pincode centroid arrays (see build_pincode_arrays)
+PINCODE_PINS_FILE = DATA_DIR / "pincode_pins.npy"
+PINCODE_COORDS_FILE = DATA_DIR / "pincode_coords.npy"
+
+# Precompiled patterns (avoids the re module's cache lookup on every call).
+# The pincode patterns start with the [1-9] class rather than \b so the re
+# engine can skip ahead to candidate digits in C; the lookbehind then
+# applies the leading word boundary (no word char before the digits).
+_PINCODE_PLAIN_RE = re.compile(r'([1-9]\d{5})(?<!\w\d{6})\b')
+# Plain and separated ("400 001", "400-001") pincodes in one pattern
+_PINCODE_RE = re.compile(r'([1-9]\d{2})(?<!\w\d{3})[\s\-]?(\d{3})\b')
+_PINCODE_VALIDATE_RE = re.compile(r'^[1-9]\d{5}$')
+_PINCODE_STRIP_RE = re.compile(r'[\s\-]')
+
 
 # =============================================================================
 # TEXT UTILITIES
 # =============================================================================
 
+@lru_cache(maxsize=65536)
 def clean_text(text: str) -> str:
     """
     Basic text cleaning: lowercase, normalize whitespace, strip edges.
     
     We preserve most punctuation as it can be meaningful in addresses
     (e.g., hyphens in pincodes, slashes in building numbers).
+    
+    Results are memoized: address corpora repeat the same strings often.
+    Long-running services can call clean_text.cache_clear().
     """
     if not text:
         return ""
     
-    # Normalize unicode (important for Devanagari and other Indian scripts)
-    text = unicodedata.normalize("NFKC", text)
+    # Normalize unicode (important for Devanagari and other Indian scripts).
+    # ASCII is already NFKC-stable, so the common transliterated case skips it.
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
     
     # Lowercase for consistent matching
     text = text.lower()
     
-    # Normalize whitespace (multiple spaces, tabs, newlines -> single space)
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    # Normalize whitespace (multiple spaces, tabs, newlines -> single space);
+    # split/join also strips the edges and beats a regex on short strings
+    return ' '.join(text.split())
 
 
 def remove_special_chars(text: str, keep_chars: str = ".,/-#") -> str:
@@ -54,16 +93,36 @@ def remove_special_chars(text: str, keep_chars: str = ".,/-#") -> str:
         text: Input text
         keep_chars: Characters to preserve (default includes common address punctuation)
     """
-    # Build pattern to remove chars not in: alphanumeric, space, or keep_chars
+    # Most addresses are plain ASCII: str.translate with a prebuilt delete
+    # table is a single C loop, no regex engine involved
+    if text.isascii():
+        return text.translate(_ascii_strip_table(keep_chars))
+    return _compile_keep(keep_chars).sub('', text)
+
+
+@lru_cache(maxsize=32)
+def _compile_keep(keep_chars: str) -> re.Pattern:
+    """Compiled pattern for chars not in: alphanumeric, space, or keep_chars."""
     escaped_keep = re.escape(keep_chars)
-    pattern = rf'[^\w\s{escaped_keep}]'
+    return re.compile(rf'[^\w\s{escaped_keep}]')
+
+
+@lru_cache(maxsize=32)
+def _ascii_strip_table(keep_chars: str) -> dict:
+    """
+    str.translate table deleting the ASCII chars _compile_keep would remove.
     
-    return re.sub(pattern, '', text)
+    Built from the regex itself so both paths agree exactly, including the
+    ASCII separator controls that the regex treats as whitespace.
+    """
+    pattern = _compile_keep(keep_chars)
+    return str.maketrans('', '', ''.join(chr(c) for c in range(128) if pattern.match(chr(c))))
 
 
+@lru_cache(maxsize=65536)
 def normalize_whitespace(text: str) -> str:
-    """Collapse multiple spaces and trim."""
-    return re.sub(r'\s+', ' ', text).strip()
+    """Collapse multiple spaces and trim (memoized like clean_text)."""
+    return ' '.join(text.split())
 
 
 # =============================================================================
@@ -98,6 +157,110 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def haversine_distance_fast(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    threshold_km: float = 1.0,
+) -> float:
+    """
+    Great-circle distance that trades a little precision for fewer trig calls.
+    
+    Points further apart than threshold_km use the spherical law of cosines
+    (one acos, fewer sin/cos than haversine). Above the threshold its
+    rounding error stays under a meter, far inside a pincode centroid's own
+    error, so it suits bulk ranking rather than precise measurement.
+    Closer points fall back to haversine_distance(), since acos loses
+    precision as its argument approaches 1.
+    
+    Args:
+        lat1, lon1: First point coordinates in degrees
+        lat2, lon2: Second point coordinates in degrees
+        threshold_km: Separation below which the exact formula is used
+        
+    Returns:
+        Distance in kilometers
+    """
+    lat1r = math.radians(lat1)
+    lat2r = math.radians(lat2)
+    dlon = math.radians(lon2 - lon1)
+    
+    # Cheap separation estimate in radians (an upper bound on the true angle)
+    if abs(lat2r - lat1r) + abs(dlon) <= threshold_km / 6371.0:
+        return haversine_distance(lat1, lon1, lat2, lon2)
+    
+    cos_c = math.sin(lat1r) * math.sin(lat2r) + math.cos(lat1r) * math.cos(lat2r) * math.cos(dlon)
+    
+    # Clamp: rounding can push cos_c marginally outside [-1, 1]
+    return 6371.0 * math.acos(max(-1.0, min(1.0, cos_c)))
+
+
+def make_haversine_from(lat1: float, lon1: float):
+    """
+    Build a distance function with a fixed origin.
+    
+    The origin's radians and cosine are computed once, so ranking many
+    candidates against one query point does half the trig per call.
+    
+    Args:
+        lat1, lon1: Origin coordinates in degrees
+        
+    Returns:
+        Function (lat2, lon2) -> distance in kilometers
+    """
+    lat1r = math.radians(lat1)
+    lon1r = math.radians(lon1)
+    cos1 = math.cos(lat1r)
+    
+    def _distance(lat2: float, lon2: float) -> float:
+        lat2r = math.radians(lat2)
+        dlat = lat2r - lat1r
+        dlon = math.radians(lon2) - lon1r
+        a = math.sin(dlat * 0.5) ** 2 + cos1 * math.cos(lat2r) * math.sin(dlon * 0.5) ** 2
+        return 12742.0 * math.asin(math.sqrt(a))  # 2 * Earth radius (km)
+    
+    return _distance
+
+
+def haversine_distance_batch(
+    lat1: float,
+    lon1: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> np.ndarray:
+    """
+    Great-circle distances from one point to many, in kilometers.
+    
+    Same formula as haversine_distance(), evaluated with NumPy ufuncs so
+    ranking N candidates is one vectorized pass instead of N Python calls.
+    With numba installed it runs the compiled parallel kernel instead,
+    which skips NumPy's temporary arrays.
+    
+    Args:
+        lat1, lon1: Origin coordinates in degrees
+        lats, lons: 1-D arrays of destination coordinates in degrees
+        
+    Returns:
+        Array of distances in kilometers, same length as lats
+    """
+    if NUMBA_AVAILABLE:
+        lats = np.ascontiguousarray(lats, dtype=np.float64)
+        lons = np.ascontiguousarray(lons, dtype=np.float64)
+        return haversine_batch_nb(lat1, lon1, lats, lons)
+    
+    lat1r = np.radians(lat1)
+    lon1r = np.radians(lon1)
+    latr = np.radians(np.asarray(lats, dtype=np.float64))
+    lonr = np.radians(np.asarray(lons, dtype=np.float64))
+    
+    dlat = latr - lat1r
+    dlon = lonr - lon1r
+    a = np.sin(dlat * 0.5) ** 2 + np.cos(lat1r) * np.cos(latr) * np.sin(dlon * 0.5) ** 2
+    
+    return 6371.0 * 2.0 * np.arcsin(np.sqrt(a))
+
+
 def is_within_india(lat: float, lon: float) -> bool:
     """
     Quick bounds check if coordinates are roughly within India.
@@ -108,7 +271,51 @@ def is_within_india(lat: float, lon: float) -> bool:
     
     This is a coarse filter to catch obviously wrong geocoding results.
     """
-    return 6.0 <= lat <= 36.0 and 68.0 <= lon <= 98.0
+    # Longitude first: it rejects more out-of-range global inputs
+    return 68.0 <= lon <= 98.0 and 6.0 <= lat <= 36.0
+
+
+def is_within_india_mask(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Vectorized is_within_india() over coordinate arrays.
+    
+    Returns:
+        Boolean array, True where the point is inside India's bounding box
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    return (lats >= 6.0) & (lats <= 36.0) & (lons >= 68.0) & (lons <= 98.0)
+
+
+def filter_nearby(
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    r_km: float,
+) -> np.ndarray:
+    """
+    Select candidates within r_km of an origin that are also inside India.
+    
+    Combines haversine_distance_batch() and is_within_india_mask() into the
+    common "nearby and plausible" query. With numba installed this is one
+    fused, parallel loop that skips the trig for out-of-bounds points.
+    
+    Args:
+        lat0, lon0: Origin coordinates in degrees
+        lats, lons: 1-D arrays of candidate coordinates in degrees
+        r_km: Search radius in kilometers
+        
+    Returns:
+        Boolean array, True for candidates to keep
+    """
+    lats = np.ascontiguousarray(lats, dtype=np.float64)
+    lons = np.ascontiguousarray(lons, dtype=np.float64)
+    
+    if NUMBA_AVAILABLE:
+        return filter_nearby_nb(lat0, lon0, lats, lons, r_km)
+    
+    return is_within_india_mask(lats, lons) & (haversine_distance_batch(lat0, lon0, lats, lons) <= r_km)
 
 
 # =============================================================================
@@ -129,10 +336,10 @@ def validate_pincode(pincode: str) -> bool:
         return False
     
     # Remove any spaces or hyphens that might be present
-    pincode = re.sub(r'[\s\-]', '', str(pincode))
+    pincode = _PINCODE_STRIP_RE.sub('', str(pincode))
     
     # Must be exactly 6 digits, first digit 1-9
-    return bool(re.match(r'^[1-9]\d{5}$', pincode))
+    return bool(_PINCODE_VALIDATE_RE.match(pincode))
 
 
 def extract_pincode(text: str) -> Optional[str]:
@@ -145,22 +352,36 @@ def extract_pincode(text: str) -> Optional[str]:
     - "mumbai - 400001" (city prefix)
     - "pin: 400001" (with label)
     """
-    # Pattern matches 6-digit sequences that look like pincodes
-    # Negative lookbehind/ahead to avoid matching phone numbers
-    patterns = [
-        r'\b([1-9]\d{5})\b',  # Plain 6 digits
-        r'\b([1-9]\d{2})[\s\-]?(\d{3})\b',  # With separator
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            # Join groups if split by separator
-            pincode = ''.join(match.groups())
-            if validate_pincode(pincode):
-                return pincode
+    # One scan covers both formats; word boundaries avoid matching inside
+    # longer digit runs such as phone numbers. The pattern already enforces
+    # the 1-9 lead digit, so no separate validation is needed.
+    match = _PINCODE_RE.search(text)
+    if match is None:
+        return None
     
-    return None
+    # A plain 6-digit pincode takes priority over an earlier separated one
+    if match.end() - match.start() > 6:
+        plain = _PINCODE_PLAIN_RE.search(text, match.end())
+        if plain:
+            return plain.group(1)
+    
+    # Join groups if split by separator
+    return match.group(1) + match.group(2)
+
+
+# Postal region by pincode first digit (index 0 unused: no region 0)
+_REGIONS = (
+    '',
+    'Northern',
+    'Uttar Pradesh',
+    'Western',
+    'Western-Central',
+    'Southern',
+    'Southern',
+    'Eastern',
+    'Eastern',
+    'APO/FPO',
+)
 
 
 def get_pincode_region(pincode: str) -> Optional[str]:
@@ -181,25 +402,92 @@ def get_pincode_region(pincode: str) -> Optional[str]:
     if not validate_pincode(pincode):
         return None
     
-    regions = {
-        '1': 'Northern',
-        '2': 'Uttar Pradesh',
-        '3': 'Western',
-        '4': 'Western-Central',
-        '5': 'Southern',
-        '6': 'Southern',
-        '7': 'Eastern',
-        '8': 'Eastern',
-        '9': 'APO/FPO',
-    }
-    
-    return regions.get(pincode[0])
+    c = pincode[0]
+    return _REGIONS[ord(c) - 48] if '1' <= c <= '9' else None
 
 
 # =============================================================================
 # DATA LOADING UTILITIES
 # =============================================================================
 
+def _read_json(path: Path):
+    """
+    Parse a JSON data file, with orjson when it is installed.
+    
+    Raises FileNotFoundError like open() so loaders keep their fallbacks.
+    """
+    if ORJSON_AVAILABLE:
+        # orjson parses straight from bytes, skipping the text decode step
+        return orjson.loads(path.read_bytes())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _cache_dir() -> Path:
+    """
+    Directory for derived data caches, outside the installed package.
+    
+    Honours GEOSPATIAL_NLP_CACHE_DIR, then XDG_CACHE_HOME, then ~/.cache.
+    """
+    override = os.environ.get("GEOSPATIAL_NLP_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "geospatial_nlp"
+
+
+def _load_cached(json_path: Path):
+    """
+    Load a JSON data file through a pickle cache in the user cache directory.
+    
+    The pickle is used when it is at least as new as the JSON; otherwise the
+    JSON is parsed and the pickle rewritten. Unpickling the finished dicts
+    skips JSON tokenizing on cold starts. The cache name includes a hash of
+    the JSON's path so separate installs never share a pickle.
+    
+    Cache writes are best effort and atomic: the pickle is written to a temp
+    file in the cache directory and os.replace()d into place, so concurrent
+    processes never read a partial file.
+    
+    Only used with the stdlib json parser: orjson already parses these
+    files faster than the pickle round trip (stat + open + unpickle).
+    
+    Raises FileNotFoundError when the JSON itself is missing.
+    """
+    if ORJSON_AVAILABLE:
+        return _read_json(json_path)
+    
+    json_mtime = json_path.stat().st_mtime
+    cache_dir = _cache_dir()
+    path_hash = hashlib.sha1(str(json_path.resolve()).encode()).hexdigest()[:12]
+    pkl_path = cache_dir / f"{json_path.stem}-{path_hash}.pkl"
+    
+    try:
+        if pkl_path.stat().st_mtime >= json_mtime:
+            with open(pkl_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # Missing or unreadable cache: rebuild from JSON
+    
+    data = _read_json(json_path)
+    tmp_path = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pkl_path)
+    except OSError:
+        # Read-only or unavailable cache directory: just use the parsed JSON
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return data
+
+
 @lru_cache(maxsize=1)
 def load_indian_states() -> Dict[str, dict]:
     """
@@ -207,36 +495,91 @@ def load_indian_states() -> Dict[str, dict]:
     
     Returns dict mapping state codes to state info including:
     - name: Full state name
-    - aliases: Common abbreviations and alternate names
+    - aliases: Frozenset of lowercase abbreviations and alternate names,
+      so membership checks are O(1) with no per-call lowering
     - capital: State capital
+    
+    Codes and aliases are interned, so the alias index and every consumer
+    share one string object per spelling.
     """
     try:
-        with open(DATA_DIR / "indian_states.json", 'r', encoding='utf-8') as f:
-            return json.load(f)
+        states = _load_cached(DATA_DIR / "indian_states.json")
     except FileNotFoundError:
         # Return minimal fallback data if file not found
         return _get_fallback_states()
+    
+    return {
+        sys.intern(code): {
+            **info,
+            "aliases": frozenset(sys.intern(alias.lower()) for alias in info.get("aliases", [])),
+        }
+        for code, info in states.items()
+    }
 
 
-def _get_fallback_states() -> Dict[str, dict]:
+@lru_cache(maxsize=1)
+def _state_search_keys() -> Tuple[Tuple[str, str, Tuple[str, ...]], ...]:
+    """
+    (code, lowercase name, space-padded aliases) per state, built once.
+    
+    Kept in reference-data order so find_state_in_text() is a first-match
+    scan. Aliases are already lowercase; the padding makes them match as
+    whole words against the padded text.
+    """
+    return tuple(
+        (code, info["name"].lower(), tuple(f" {alias} " for alias in info.get("aliases", ())))
+        for code, info in load_indian_states().items()
+    )
+
+
+def find_state_in_text(text: str) -> Optional[str]:
+    """
+    Find the first state whose name or alias appears in free text.
+    
+    Names match anywhere in the text; aliases only as whole words, so
+    "up" does not fire inside "pune". Use resolve_state_name() when the
+    whole string is a state name.
+    
+    Returns:
+        State code (e.g., "MH"), or None
+    """
+    text_lower = text.lower()
+    padded = f" {text_lower} "
+    
+    for code, name, aliases in _state_search_keys():
+        if name in text_lower:
+            return code
+        for alias in aliases:
+            if alias in padded:
+                return code
+    
+    return None
+
+
+# Minimal built-in data for when the JSON files are missing. Built once and
+# read-only, since the @lru_cache loaders hand the same object to every caller
+_FALLBACK_STATES: Mapping[str, Mapping] = MappingProxyType({
+    "MH": MappingProxyType({"name": "Maharashtra", "aliases": frozenset({"mh", "maha", "maharashtra"}), "capital": "Mumbai"}),
+    "DL": MappingProxyType({"name": "Delhi", "aliases": frozenset({"dl", "delhi", "new delhi", "ncr"}), "capital": "New Delhi"}),
+    "KA": MappingProxyType({"name": "Karnataka", "aliases": frozenset({"ka", "karnataka", "ktk"}), "capital": "Bengaluru"}),
+    "TN": MappingProxyType({"name": "Tamil Nadu", "aliases": frozenset({"tn", "tamilnadu", "tamil nadu"}), "capital": "Chennai"}),
+    "UP": MappingProxyType({"name": "Uttar Pradesh", "aliases": frozenset({"up", "uttar pradesh"}), "capital": "Lucknow"}),
+    "GJ": MappingProxyType({"name": "Gujarat", "aliases": frozenset({"gj", "gujarat", "guj"}), "capital": "Gandhinagar"}),
+    "RJ": MappingProxyType({"name": "Rajasthan", "aliases": frozenset({"rj", "rajasthan", "raj"}), "capital": "Jaipur"}),
+    "WB": MappingProxyType({"name": "West Bengal", "aliases": frozenset({"wb", "west bengal", "bengal"}), "capital": "Kolkata"}),
+    "AP": MappingProxyType({"name": "Andhra Pradesh", "aliases": frozenset({"ap", "andhra", "andhra pradesh"}), "capital": "Amaravati"}),
+    "TS": MappingProxyType({"name": "Telangana", "aliases": frozenset({"ts", "telangana", "tg"}), "capital": "Hyderabad"}),
+    "KL": MappingProxyType({"name": "Kerala", "aliases": frozenset({"kl", "kerala"}), "capital": "Thiruvananthapuram"}),
+    "MP": MappingProxyType({"name": "Madhya Pradesh", "aliases": frozenset({"mp", "madhya pradesh"}), "capital": "Bhopal"}),
+    "BR": MappingProxyType({"name": "Bihar", "aliases": frozenset({"br", "bihar"}), "capital": "Patna"}),
+    "PB": MappingProxyType({"name": "Punjab", "aliases": frozenset({"pb", "punjab"}), "capital": "Chandigarh"}),
+    "HR": MappingProxyType({"name": "Haryana", "aliases": frozenset({"hr", "haryana"}), "capital": "Chandigarh"}),
+})
+
+
+def _get_fallback_states() -> Mapping[str, Mapping]:
     """Fallback state data if JSON file is missing."""
-    return {
-        "MH": {"name": "Maharashtra", "aliases": ["mh", "maha", "maharashtra"], "capital": "Mumbai"},
-        "DL": {"name": "Delhi", "aliases": ["dl", "delhi", "new delhi", "ncr"], "capital": "New Delhi"},
-        "KA": {"name": "Karnataka", "aliases": ["ka", "karnataka", "ktk"], "capital": "Bengaluru"},
-        "TN": {"name": "Tamil Nadu", "aliases": ["tn", "tamilnadu", "tamil nadu"], "capital": "Chennai"},
-        "UP": {"name": "Uttar Pradesh", "aliases": ["up", "uttar pradesh"], "capital": "Lucknow"},
-        "GJ": {"name": "Gujarat", "aliases": ["gj", "gujarat", "guj"], "capital": "Gandhinagar"},
-        "RJ": {"name": "Rajasthan", "aliases": ["rj", "rajasthan", "raj"], "capital": "Jaipur"},
-        "WB": {"name": "West Bengal", "aliases": ["wb", "west bengal", "bengal"], "capital": "Kolkata"},
-        "AP": {"name": "Andhra Pradesh", "aliases": ["ap", "andhra", "andhra pradesh"], "capital": "Amaravati"},
-        "TS": {"name": "Telangana", "aliases": ["ts", "telangana", "tg"], "capital": "Hyderabad"},
-        "KL": {"name": "Kerala", "aliases": ["kl", "kerala"], "capital": "Thiruvananthapuram"},
-        "MP": {"name": "Madhya Pradesh", "aliases": ["mp", "madhya pradesh"], "capital": "Bhopal"},
-        "BR": {"name": "Bihar", "aliases": ["br", "bihar"], "capital": "Patna"},
-        "PB": {"name": "Punjab", "aliases": ["pb", "punjab"], "capital": "Chandigarh"},
-        "HR": {"name": "Haryana", "aliases": ["hr", "haryana"], "capital": "Chandigarh"},
-    }
+    return _FALLBACK_STATES
 
 
 @lru_cache(maxsize=1)
@@ -247,78 +590,271 @@ def load_landmark_patterns() -> Dict[str, List[str]]:
     Returns dict mapping landmark categories to pattern lists.
     """
     try:
-        with open(DATA_DIR / "landmarks.json", 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_cached(DATA_DIR / "landmarks.json")
     except FileNotFoundError:
         return _get_fallback_landmarks()
 
 
-def _get_fallback_landmarks() -> Dict[str, List[str]]:
+_FALLBACK_LANDMARKS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "religious": ("temple", "mandir", "masjid", "mosque", "church", "gurudwara", "dargah"),
+    "transport": ("railway station", "bus stand", "bus stop", "metro station", "airport"),
+    "commercial": ("market", "mall", "shop", "bazaar", "mandi"),
+    "education": ("school", "college", "university", "vidyalaya", "institute"),
+    "health": ("hospital", "clinic", "dispensary", "medical"),
+    "government": ("police station", "post office", "court", "collector office"),
+    "infrastructure": ("bridge", "flyover", "signal", "chowk", "circle", "square"),
+})
+
+
+def _get_fallback_landmarks() -> Mapping[str, Tuple[str, ...]]:
     """Fallback landmark patterns if JSON file is missing."""
-    return {
-        "religious": ["temple", "mandir", "masjid", "mosque", "church", "gurudwara", "dargah"],
-        "transport": ["railway station", "bus stand", "bus stop", "metro station", "airport"],
-        "commercial": ["market", "mall", "shop", "bazaar", "mandi"],
-        "education": ["school", "college", "university", "vidyalaya", "institute"],
-        "health": ["hospital", "clinic", "dispensary", "medical"],
-        "government": ["police station", "post office", "court", "collector office"],
-        "infrastructure": ["bridge", "flyover", "signal", "chowk", "circle", "square"],
-    }
+    return _FALLBACK_LANDMARKS
+
+
+def _pin_code(pincode) -> int:
+    """Integer form of a plain ASCII 6-digit pincode string, else 0."""
+    if type(pincode) is str and len(pincode) == 6 and pincode.isascii() and pincode.isdigit():
+        return int(pincode)
+    return 0
+
+
+class PincodeCentroids(Mapping):
+    """
+    Read-only pincode -> (lat, lon) mapping over two parallel arrays.
+    
+    Stores pincodes as uint32 and coordinates as an (N, 2) float64 array
+    instead of a dict of per-entry Python objects, so the table costs
+    about 20 bytes per pincode and can be memory-mapped straight from the
+    .npy files. Lookups binary-search a sorted copy of the pincodes;
+    iteration keeps the source file order, like the dict it replaces.
+    
+    Attributes:
+        pins: Pincodes as integers, in source order
+        coords: Matching (lat, lon) rows in degrees
+    """
+    
+    def __init__(self, pins: np.ndarray, coords: np.ndarray):
+        # asarray drops the memmap subclass (still backed by the mapping),
+        # which makes scalar indexing noticeably cheaper
+        self.pins = np.asarray(pins)
+        self.coords = np.asarray(coords)
+        self._order = np.argsort(self.pins, kind="stable")
+        self._sorted_pins = self.pins[self._order]
+        
+        # Single-key lookups go through memoryviews: bisect and indexing on
+        # them return plain Python ints/floats without numpy scalar overhead
+        self._sorted_view = memoryview(self._sorted_pins)
+        self._order_view = memoryview(self._order)
+        self._coords_view = memoryview(np.ascontiguousarray(self.coords).reshape(-1))
+    
+    def __reduce__(self):
+        # The memoryviews cannot be pickled; rebuild them from the arrays
+        return (type(self), (self.pins, self.coords))
+    
+    @classmethod
+    def from_npy(cls, pins_path: Path, coords_path: Path) -> "PincodeCentroids":
+        """Memory-map arrays written by build_pincode_arrays()."""
+        return cls(np.load(pins_path, mmap_mode='r'), np.load(coords_path, mmap_mode='r'))
+    
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Sequence[float]]) -> "PincodeCentroids":
+        """Pack a pincode string -> (lat, lon) mapping, keeping its order."""
+        pins = np.array([int(pin) for pin in data], dtype=np.uint32)
+        coords = np.array(list(data.values()), dtype=np.float64).reshape(-1, 2)
+        return cls(pins, coords)
+    
+    def _index(self, pincode) -> int:
+        """Row of pincode in the source arrays, or -1 if absent."""
+        code = _pin_code(pincode)
+        if not code:
+            return -1
+        view = self._sorted_view
+        pos = bisect_left(view, code)
+        if pos < len(view) and view[pos] == code:
+            return self._order_view[pos]
+        return -1
+    
+    def __getitem__(self, pincode: str) -> Tuple[float, float]:
+        row = self._index(pincode)
+        if row < 0:
+            raise KeyError(pincode)
+        return (self._coords_view[2 * row], self._coords_view[2 * row + 1])
+    
+    def get(self, pincode, default=None):
+        # Same as Mapping.get without raising and catching a KeyError
+        row = self._index(pincode)
+        if row < 0:
+            return default
+        return (self._coords_view[2 * row], self._coords_view[2 * row + 1])
+    
+    def __contains__(self, pincode) -> bool:
+        return self._index(pincode) >= 0
+    
+    def __iter__(self) -> Iterator[str]:
+        return (str(pin) for pin in self.pins.tolist())
+    
+    def __len__(self) -> int:
+        return len(self.pins)
+    
+    def items(self) -> ItemsView:
+        # Walk the arrays directly instead of a binary search per key
+        return _PincodeItems(self)
+    
+    def lookup_many(self, pincodes: Iterable[str]) -> np.ndarray:
+        """
+        Vectorized lookup of many pincodes.
+        
+        Args:
+            pincodes: Pincode strings; invalid or unknown ones are allowed
+            
+        Returns:
+            (N, 2) float64 array of (lat, lon), NaN rows where not found
+        """
+        codes = np.fromiter((_pin_code(p) for p in pincodes), dtype=np.int64)
+        out = np.full((len(codes), 2), np.nan)
+        if not len(self._sorted_pins):
+            return out
+        
+        pos = np.minimum(np.searchsorted(self._sorted_pins, codes), len(self._sorted_pins) - 1)
+        found = self._sorted_pins[pos] == codes
+        out[found] = self.coords[self._order[pos[found]]]
+        return out
+
+
+class _PincodeItems(ItemsView):
+    """Items view over PincodeCentroids that zips the arrays in order."""
+    
+    def __iter__(self):
+        centroids = self._mapping
+        return zip(centroids, map(tuple, centroids.coords.tolist()))
+
+
+def build_pincode_arrays(
+    json_path: Path = DATA_DIR / "pincode_centroids.json",
+    pins_path: Path = PINCODE_PINS_FILE,
+    coords_path: Path = PINCODE_COORDS_FILE,
+) -> int:
+    """
+    Convert pincode_centroids.json into the packed .npy arrays.
+    
+    Re-run after editing the JSON; load_pincode_centroids() prefers the
+    arrays whenever both files exist.
+    
+    Returns:
+        Number of pincodes written
+    """
+    table = PincodeCentroids.from_mapping(_read_json(Path(json_path)))
+    
+    np.save(pins_path, table.pins)
+    np.save(coords_path, table.coords)
+    return len(table)
 
 
 @lru_cache(maxsize=1)
-def load_pincode_centroids() -> Dict[str, Tuple[float, float]]:
+def load_pincode_centroids() -> PincodeCentroids:
     """
     Load pincode to centroid coordinate mappings.
     
-    Returns dict mapping pincode strings to (lat, lon) tuples.
+    Returns a read-only PincodeCentroids mapping pincode strings to
+    (lat, lon) tuples: memory-mapped from the packed .npy arrays when they
+    exist, otherwise packed from the JSON (or the built-in fallback).
+    Either way pincodes are held as integers, so lookups compare ints
+    instead of hashing 6-character strings.
     """
+    if PINCODE_PINS_FILE.exists() and PINCODE_COORDS_FILE.exists():
+        return PincodeCentroids.from_npy(PINCODE_PINS_FILE, PINCODE_COORDS_FILE)
+    
     try:
-        with open(DATA_DIR / "pincode_centroids.json", 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return {k: tuple(v) for k, v in data.items()}
+        data = _load_cached(DATA_DIR / "pincode_centroids.json")
     except FileNotFoundError:
-        return _get_fallback_pincodes()
+        data = _get_fallback_pincodes()
+    return PincodeCentroids.from_mapping(data)
+
+
+_FALLBACK_PINCODES: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    # Mumbai
+    "400001": (18.9398, 72.8354),  # Fort
+    "400069": (19.1136, 72.8697),  # Andheri East
+    "400028": (19.0178, 72.8478),  # Dadar
+    # Delhi
+    "110001": (28.6358, 77.2245),  # Connaught Place
+    "110020": (28.5672, 77.2100),  # Hauz Khas
+    # Bengaluru
+    "560001": (12.9767, 77.5713),  # MG Road
+    "560034": (12.9352, 77.6245),  # Koramangala
+    # Chennai
+    "600001": (13.0878, 80.2785),  # Parrys
+    # Hyderabad
+    "500001": (17.3850, 78.4867),  # Abids
+    # Kolkata
+    "700001": (22.5726, 88.3639),  # BBD Bagh
+    # Pune
+    "411001": (18.5204, 73.8567),  # Camp
+})
+
+
+def _get_fallback_pincodes() -> Mapping[str, Tuple[float, float]]:
+    """Fallback pincode data - major city pincodes."""
+    return _FALLBACK_PINCODES
 
 
-def _get_fallback_pincodes() -> Dict[str, Tuple[float, float]]:
-    """Fallback pincode data - major city pincodes."""
-    return {
-        # Mumbai
-        "400001": (18.9398, 72.8354),  # Fort
-        "400069": (19.1136, 72.8697),  # Andheri East
-        "400028": (19.0178, 72.8478),  # Dadar
-        # Delhi
-        "110001": (28.6358, 77.2245),  # Connaught Place
-        "110020": (28.5672, 77.2100),  # Hauz Khas
-        # Bengaluru
-        "560001": (12.9767, 77.5713),  # MG Road
-        "560034": (12.9352, 77.6245),  # Koramangala
-        # Chennai
-        "600001": (13.0878, 80.2785),  # Parrys
-        # Hyderabad
-        "500001": (17.3850, 78.4867),  # Abids
-        # Kolkata
-        "700001": (22.5726, 88.3639),  # BBD Bagh
-        # Pune
-        "411001": (18.5204, 73.8567),  # Camp
-    }
+def warmup() -> None:
+    """
+    Load the state, landmark and pincode data concurrently.
+    
+    The three loaders are independent and mostly wait on file reads, which
+    release the GIL, so running them on threads overlaps their disk
+    latency. Call once at application startup; the loaders' @lru_cache
+    makes later calls (and repeat warmups) free.
+    """
+    loaders = (load_indian_states, load_landmark_patterns, load_pincode_centroids)
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        # Drain the results so loader exceptions surface here
+        list(executor.map(lambda load: load(), loaders))
+
+
+@lru_cache(maxsize=1)
+def _state_alias_index() -> Dict[str, str]:
+    """
+    Flat name/alias -> state code index, built once.
+    
+    Insertion follows the state data order (each state's name, then its
+    aliases), and the first state to claim a lowercase key keeps it,
+    matching the linear scan this replaces. Each spelling is then also
+    keyed as written and in upper case ("Maharashtra", "MAHARASHTRA"),
+    mapped to whatever its lowercase form resolves to, so inputs in those
+    common forms hit without a lower() copy.
+    
+    A plain dict is deliberate: for ~70 short keys its C-level probe costs
+    well under 100ns, less than a single Python-level call, so a generated
+    perfect hash (gperf, or a pure-Python G table) has nothing left to win.
+    """
+    index = {}
+    spellings = []
+    for code, info in load_indian_states().items():
+        for spelling in (info["name"], *info.get("aliases", [])):
+            index.setdefault(sys.intern(spelling.lower()), code)
+            spellings.append(spelling)
+    
+    for spelling in spellings:
+        code = index[spelling.lower()]
+        index.setdefault(sys.intern(spelling), code)
+        index.setdefault(sys.intern(spelling.upper()), code)
+    return index
 
 
+@lru_cache(maxsize=4096)
 def resolve_state_name(text: str) -> Optional[str]:
     """
     Try to identify a state from text using aliases.
     
     Returns the canonical state code (e.g., "MH" for Maharashtra).
-    """
-    text_lower = text.lower().strip()
-    states = load_indian_states()
     
-    for code, info in states.items():
-        # Check against full name and all aliases
-        if text_lower == info["name"].lower():
-            return code
-        if text_lower in [a.lower() for a in info.get("aliases", [])]:
-            return code
-    
-    return None
+    Memoized on the raw input: the same few state spellings recur across
+    addresses, so repeats skip the lower/strip and the index lookup.
+    Misses probe the stripped text first, since the index also holds
+    as-written and upper-case spellings, and lowercase only if that fails.
+    """
+    index = _state_alias_index()
+    key = text.strip()
+    return index.get(key) or index.get(key.lower())